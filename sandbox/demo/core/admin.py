@@ -1,12 +1,46 @@
 from django.contrib import admin
+from django.db import models
 from django.template.defaultfilters import linebreaksbr
 from unfold.admin import ModelAdmin
 
 from .models import Act, Play, Scene, Speaker, Speech
 
+#: The related objects each model's ``__str__`` uses, which we load along with
+#: it wherever the admin lists objects by their labels, rather than querying for
+#: them once for each object.
+LABEL_RELATIONS: dict[type[models.Model], tuple[str, ...]] = {
+    Act: ("play",),
+    Scene: ("play", "act"),
+    Speech: ("speaker", "scene__play", "scene__act"),
+}
+
+
+class LabelRelatedFieldListFilter(admin.RelatedFieldListFilter):
+    """A related field filter that loads what its choices' labels use."""
+
+    def field_choices(self, field, request, model_admin):
+        queryset = field.related_model._default_manager.select_related(  # noqa: SLF001
+            *LABEL_RELATIONS.get(field.related_model, ())
+        )
+        if ordering := self.field_admin_ordering(field, request, model_admin):
+            queryset = queryset.order_by(*ordering)
+        return [(obj.pk, str(obj)) for obj in queryset]
+
+
+class LabelRelatedMixin:
+    """Load what the labels of our foreign key choices use along with them."""
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        formfield = super().formfield_for_foreignkey(db_field, request, **kwargs)
+        if formfield is not None and (
+            relations := LABEL_RELATIONS.get(db_field.related_model)
+        ):
+            formfield.queryset = formfield.queryset.select_related(*relations)
+        return formfield
+
 
 @admin.register(Speech)
-class SpeechAdmin(ModelAdmin):
+class SpeechAdmin(LabelRelatedMixin, ModelAdmin):
     list_display = (
         "id",
         "speaker",
@@ -16,7 +50,13 @@ class SpeechAdmin(ModelAdmin):
         "scene_bare",
         "created_date",
     )
-    list_filter = ("speaker", "scene", "scene__act", "scene__act__play", "created_date")
+    list_filter = (
+        "speaker",
+        ("scene", LabelRelatedFieldListFilter),
+        ("scene__act", LabelRelatedFieldListFilter),
+        "scene__act__play",
+        "created_date",
+    )
     search_fields = (
         "text",
         "speaker__name",
@@ -103,15 +143,15 @@ class ActAdmin(ModelAdmin):
 
 
 @admin.register(Scene)
-class SceneAdmin(ModelAdmin):
+class SceneAdmin(LabelRelatedMixin, ModelAdmin):
     list_display = ("id", "play__title", "act_bare", "scene_bare", "order")
-    list_filter = ("play", "act")
+    list_filter = ("play", ("act", LabelRelatedFieldListFilter))
     search_fields = ("name", "act__name", "play__title", "id")
     ordering = ("play", "act", "order")
     list_per_page = 100
     list_max_show_all = 100
     list_display_links = ("id", "name")
-    list_select_related = ("act",)
+    list_select_related = ("act", "play")
 
     @admin.display(description="Scene", ordering="scene")
     def scene_bare(self, obj: Scene) -> str:
@@ -0,0 +1,256 @@
+import json
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest import mock
+
+import pytest
+from django.conf import settings
+from opensearchpy.serializer import JSONSerializer
+from pytest_django import DjangoDbBlocker
+
+from demo.core.importers import PlayData, PlayImporter
+from django_haystack_opensearch.haystack import OpenSearchSearchBackend
+
+
+def create_simple_play() -> str:
+    """Create a simple play text for testing."""
+    return """PROLOGUE
+========
+
+[Enter Chorus as Prologue.]
+
+CHORUS
+O, for a muse of fire that would ascend
+The brightest heaven of invention!
+
+ACT 1
+=====
+
+Scene 1
+=======
+[Enter the two Bishops.]
+
+BISHOP OF CANTERBURY
+My lord, I'll tell you that self bill is urged
+Which in th' eleventh year of the last king's reign
+Was like, and had indeed against us passed.
+
+BISHOP OF ELY
+But how, my lord, shall we resist it now?
+
+BISHOP OF CANTERBURY
+It must be thought on. If it pass against us,
+We lose the better half of our possession.
+
+Scene 2
+=======
+[Enter the King.]
+
+KING HENRY
+Where is my gracious Lord of Canterbury?
+
+EXETER
+Not here in presence.
+
+KING HENRY  Send for him, good uncle.
+"""
+
+
+def create_entries_play() -> str:
+    """
+    Create a play with an entry of each kind for the fixture tests.
+
+    It has two scenes, so the scene entries have more than one act foreign key
+    to check.
+    """
+    return """ACT 1
+=====
+
+Scene 1
+=======
+
+SPEAKER
+Text.
+
+Scene 2
+=======
+
+SPEAKER
+More text.
+"""
+
+
+@pytest.fixture(scope="session")
+def simple_play_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """The simple play text, written to a file once for the whole session."""
+    path = tmp_path_factory.mktemp("plays") / "simple.txt"
+    path.write_text(create_simple_play(), encoding="utf-8")
+    return path
+
+
+@pytest.fixture(scope="session")
+def simple_play_data(simple_play_file: Path) -> PlayData:
+    """
+    The simple play, parsed once for the whole session.
+
+    Tests that change the data, for instance by saving it, should work on a
+    ``copy.deepcopy()`` of it.
+    """
+    return PlayImporter(input_file_path=simple_play_file, title="Test Play").parse()
+
+
+def group_by_model(
+    fixture_data: list[dict[str, Any]],
+) -> dict[str, list[dict[str, Any]]]:
+    """
+    Group fixture entries by their model, keeping their order in the fixture.
+
+    Args:
+        fixture_data: the decoded fixture entries
+
+    Returns:
+        A dict mapping each model label, like ``core.scene``, to its entries.
+
+    """
+    by_model: dict[str, list[dict[str, Any]]] = {}
+    for entry in fixture_data:
+        by_model.setdefault(entry["model"], []).append(entry)
+    return by_model
+
+
+def _generate_fixture_json(
+    tmp_path_factory: pytest.TempPathFactory,
+    play_file: Path,
+    django_db_blocker: DjangoDbBlocker,
+) -> list[dict[str, Any]]:
+    """
+    Generate the fixture for a play file, and return it decoded.
+
+    Generating a fixture reads the database to allocate primary keys, so this
+    unblocks database access while it does.
+
+    Args:
+        tmp_path_factory: makes the directory to write the fixture to
+        play_file: the play text to generate the fixture from
+        django_db_blocker: pytest-django's database access blocker
+
+    Returns:
+        The decoded fixture entries.
+
+    """
+    path = tmp_path_factory.mktemp("fixtures") / f"{play_file.stem}.json"
+    importer = PlayImporter(input_file_path=play_file, title="Test Play")
+    with django_db_blocker.unblock():
+        importer.generate_fixture(path)
+    return json.loads(path.read_bytes())
+
+
+@pytest.fixture(scope="class")
+def simple_fixture_json(
+    tmp_path_factory: pytest.TempPathFactory,
+    simple_play_file: Path,
+    django_db_setup: None,  # noqa: ARG001
+    django_db_blocker: DjangoDbBlocker,
+) -> list[dict[str, Any]]:
+    """
+    The fixture generated from the simple play, decoded once for each class.
+
+    The tests only read the database, which is back in the same state at the
+    start of each test, so the primary keys it allocated still hold.
+    """
+    return _generate_fixture_json(tmp_path_factory, simple_play_file, django_db_blocker)
+
+
+@pytest.fixture(scope="class")
+def simple_fixture_by_model(
+    simple_fixture_json: list[dict[str, Any]],
+) -> dict[str, list[dict[str, Any]]]:
+    """The simple play's fixture entries, grouped by model once for each class."""
+    return group_by_model(simple_fixture_json)
+
+
+@pytest.fixture(scope="class")
+def entries_fixture_by_model(
+    tmp_path_factory: pytest.TempPathFactory,
+    django_db_setup: None,  # noqa: ARG001
+    django_db_blocker: DjangoDbBlocker,
+) -> dict[str, list[dict[str, Any]]]:
+    """The entries play's fixture entries, grouped by model once for each class."""
+    path = tmp_path_factory.mktemp("plays") / "entries.txt"
+    path.write_text(create_entries_play(), encoding="utf-8")
+    return group_by_model(
+        _generate_fixture_json(tmp_path_factory, path, django_db_blocker)
+    )
+
+
+class FakeOpenSearch:
+    """
+    A stand-in for the OpenSearch client, for testing bulk indexing without a
+    cluster.
+
+    :meth:`bulk` records every action it is sent, in :attr:`sent`, and answers
+    each document with the next status queued for its id in :attr:`statuses`,
+    or 200 once there are none left.  Whole requests can be failed instead by
+    queueing errors for them to raise in :attr:`request_errors`.  ``indices``
+    and ``mget`` are mocks.
+    """
+
+    def __init__(self) -> None:
+        self.transport = SimpleNamespace(serializer=JSONSerializer())
+        self.indices = mock.Mock()
+        self.mget = mock.Mock(return_value={"docs": []})
+        #: The ``(op_type, metadata, source)`` of each action sent, in order.
+        self.sent: list[tuple[str, dict[str, Any], dict[str, Any] | None]] = []
+        #: The statuses to answer with for each document id, in order.
+        self.statuses: dict[str, list[int]] = {}
+        #: The errors to raise for whole requests, in order.
+        self.request_errors: list[Exception] = []
+        #: The threads bulk() was called from.
+        self.threads: set[threading.Thread] = set()
+        self._lock = threading.Lock()
+
+    def bulk(self, body: str, **kwargs: Any) -> dict[str, Any]:  # noqa: ARG002
+        lines = iter(json.loads(line) for line in body.splitlines())
+        items = []
+        with self._lock:
+            self.threads.add(threading.current_thread())
+            if self.request_errors:
+                raise self.request_errors.pop(0)
+            for action in lines:
+                ((op_type, metadata),) = action.items()
+                source = None if op_type == "delete" else next(lines)
+                self.sent.append((op_type, metadata, source))
+                queued = self.statuses.get(metadata["_id"])
+                status = queued.pop(0) if queued else 200
+                item = {"_index": metadata["_index"], "_id": metadata["_id"]}
+                item["status"] = status
+                if status == 429:  # noqa: PLR2004
+                    item["error"] = {"type": "es_rejected_execution_exception"}
+                elif status >= 300:  # noqa: PLR2004
+                    item["error"] = {"type": "mapper_parsing_exception"}
+                items.append({op_type: item})
+        return {
+            "errors": any(next(iter(i.values()))["status"] >= 300 for i in items),  # noqa: PLR2004
+            "items": items,
+        }
+
+
+@pytest.fixture
+def fake_backend() -> OpenSearchSearchBackend:
+    """
+    A search backend for the default connection that talks to a
+    :class:`FakeOpenSearch` client, with its index already set up, and that
+    raises errors rather than silently failing.
+
+    This is a fresh backend rather than the shared one from ``connections``, so
+    that replacing its client doesn't leak into other tests.
+    """
+    backend = OpenSearchSearchBackend(
+        "default", **settings.HAYSTACK_CONNECTIONS["default"]
+    )
+    backend.conn = FakeOpenSearch()
+    backend.setup_complete = True
+    backend.silently_fail = False
+    return backend
@@ -1,19 +1,26 @@
 from __future__ import annotations
 
 import json
+import mmap
 import re
+import sys
 from dataclasses import dataclass, field
+from itertools import chain
 from pathlib import Path
-from typing import Final
+from typing import TYPE_CHECKING, Any, Final, TextIO
 
 import django.db.utils
+from django.db import transaction
 from django.db.models import Max
 
 from demo.core.models import Act, Play, Scene, Speaker, Speech
 from demo.logging import logger
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
 
-@dataclass
+
+@dataclass(slots=True)
 class SpeechData:
     """Represents a single speech in a scene."""
 
@@ -25,7 +32,7 @@ class SpeechData:
     order: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SceneData:
     """Represents a scene within an act."""
 
@@ -37,7 +44,7 @@ class SceneData:
     speeches: list[SpeechData] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ActData:
     """Represents an act within a play."""
 
@@ -49,7 +56,7 @@ class ActData:
     scenes: list[SceneData] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayData:
     """Represents the complete play data."""
 
@@ -59,7 +66,7 @@ class PlayData:
     acts: list[ActData] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParserState:
     """Maintains the current parsing state."""
 
@@ -69,14 +76,15 @@ class ParserState:
     current_act: ActData | None = None
     #: The current scene.
     current_scene: SceneData | None = None
-    #: The current speech lines.
-    current_speech_lines: list[str] = field(default_factory=list)
     #: The current act order number in the play.
     act_order: int = 0
     #: The current scene order number in its act.
     scene_order: int = 0
     #: The current speech order number in its scene.
     speech_order: int = 0
+    #: The speaker of the most recent speech in the current scene that was not
+    #: a stage direction, used to attribute bare text continuations.
+    last_speaker: str | None = None
 
     @classmethod
     def new(cls, title: str) -> ParserState:
@@ -112,13 +120,16 @@ class ParserState:
             order: Order number of the new act.
 
         """
-        self.current_act = act
-        self.current_scene = None
-        self.current_speaker = None
-        self.current_speech_lines = []
-        self.act_order += 1
-        self.scene_order = 0
-        self.speech_order = 0
+        # Reset everything in one tuple assignment rather than one statement
+        # per attribute.
+        (
+            self.current_act,
+            self.current_scene,
+            self.act_order,
+            self.scene_order,
+            self.speech_order,
+            self.last_speaker,
+        ) = (act, None, self.act_order + 1, 0, 0, None)
         self.play_data.acts.append(act)
         act.order = self.act_order
 
@@ -131,11 +142,12 @@ class ParserState:
             order: Order number of the new scene.
 
         """
-        self.current_scene = scene
-        self.current_speaker = None
-        self.current_speech_lines = []
-        self.scene_order += 1
-        self.speech_order = 0
+        (
+            self.current_scene,
+            self.scene_order,
+            self.speech_order,
+            self.last_speaker,
+        ) = (scene, self.scene_order + 1, 0, None)
         self.current_act.scenes.append(scene)
         scene.order = self.scene_order
 
@@ -155,6 +167,8 @@ class ParserState:
         self.current_scene.speeches.append(speech)
         self.speech_order += 1
         speech.order = self.speech_order
+        if speech.speaker and speech.speaker != "Stage Directions":
+            self.last_speaker = speech.speaker
 
 
 class PlayImporter:
@@ -180,6 +194,12 @@ class PlayImporter:
 
     #: The number of lines required for a heading chunk.
     HEADING_LINES: Final[int] = 2
+    #: The raw lines that count as empty lines between chunks.
+    EMPTY_LINES: Final[tuple[bytes, ...]] = (b"\n", b"\r\n", b"\r")
+    #: The byte that starts a stage direction line.
+    STAGE_DIRECTION_START: Final[int] = ord("[")
+    #: The (uppercased) prefixes a PROLOGUE, ACT or Scene heading name starts with.
+    HEADING_PREFIXES: Final[tuple[str, ...]] = ("PROLOGUE", "ACT ", "SCENE ")
     #: The regex pattern for a prologue marker.
     PROLOGUE_MARKER_REGEX: Final[re.Pattern[str]] = re.compile(
         r"^PROLOGUE$", re.IGNORECASE
@@ -252,37 +272,101 @@ class PlayImporter:
             PlayData containing parsed play data with title and acts.
 
         """
-        with self.input_file_path.open(encoding="utf-8") as f:
-            text = f.read()
-
-        # Look through text and split into chunks based on empty lines
-        # and lines that start with [ (stage direction).
-        # The second regex is a lookahead to split on lines that start with [,
-        # importantly WHILE keeping the [ in the chunk.
-        chunks = re.split(r"\n{2,}|\n(?=\[)", text)
-        # Now loop through the chunks, updating the state to mark
-        # which act, scene, and speech we're currently parsing.
         state = ParserState.new(self.title)
-        for chunk in chunks:
-            lines = chunk.splitlines()
-            # Check if chunk is a prologue
-            if prologue := self.extract_prologue(lines):
-                state.add_act(prologue)
-            # Check if chunk is an act
-            elif act := self.extract_act(lines):
-                state.add_act(act)
-            # Check if chunk is a scene
-            elif scene := self.extract_scene(lines):
-                state.add_scene(scene)
-            elif stage_direction := self.extract_stage_direction(chunk):
-                state.add_speech(stage_direction)
-            elif speech := self.extract_speech(chunk):
-                state.add_speech(speech)
-            else:
-                speech = self.extract_bare_text(chunk, state)
-                state.add_speech(speech)
+        # mmap refuses to map an empty file, and there's nothing to parse anyway.
+        if not self.input_file_path.stat().st_size:
+            return state.play
+        # Map the file rather than reading it, so that chunks are found by
+        # scanning the page cache directly and only decoded once each.
+        with (
+            self.input_file_path.open("rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as text,
+        ):
+            # Loop through the chunks of the file, updating the state to mark
+            # which act, scene, and speech we're currently parsing.
+            for chunk in self.iter_chunks(text):
+                lines = chunk.splitlines()
+                # Check if chunk is a prologue, act or scene heading
+                if heading := self.extract_heading(lines):
+                    if isinstance(heading, ActData):
+                        state.add_act(heading)
+                    else:
+                        state.add_scene(heading)
+                elif stage_direction := self.extract_stage_direction(chunk):
+                    state.add_speech(stage_direction)
+                elif speech := self.extract_speech(chunk):
+                    state.add_speech(speech)
+                else:
+                    speech = self.extract_bare_text(chunk, state)
+                    state.add_speech(speech)
         return state.play
 
+    def iter_chunks(self, text: bytes | mmap.mmap) -> Iterator[str]:
+        """
+        Split the raw UTF-8 play text into chunks.
+
+        A chunk ends at an empty line, or just before a line that starts with
+        ``[`` (a stage direction), so that the ``[`` stays in the chunk it
+        starts.  A run of empty lines counts as a single chunk boundary.
+
+        Line boundaries are found on the raw bytes, and each chunk is decoded
+        only when it is yielded, so only the chunk currently being handled is
+        ever held as a Python string.  LF, CRLF and CR line endings are all
+        accepted, and the yielded chunks always use LF; a text is only split
+        on CR if it has no LF at all, as old Mac files do.
+
+        Args:
+            text: The play text as bytes, e.g. a memory-mapped file.
+
+        Yields:
+            Each non-empty chunk of text, without its trailing newline.
+
+        """
+        size = len(text)
+        # Look these up once rather than on every line of the file.
+        find = text.find
+        decode = self._decode_chunk
+        # A text with no LF at all has bare CR line endings.
+        newline = b"\n" if find(b"\n") != -1 or find(b"\r") == -1 else b"\r"
+        empty_lines = self.EMPTY_LINES
+        stage_direction_start = self.STAGE_DIRECTION_START
+        # Offset of the first line of the chunk being built, or None between
+        # chunks.
+        chunk_start: int | None = None
+        pos = 0
+        while pos < size:
+            end = find(newline, pos)
+            end = size if end == -1 else end + 1
+            is_empty = end - pos <= 2 and text[pos:end] in empty_lines  # noqa: PLR2004
+            if chunk_start is not None and (
+                is_empty or text[pos] == stage_direction_start
+            ):
+                yield decode(text[chunk_start:pos])
+                chunk_start = None
+            if chunk_start is None and not is_empty:
+                chunk_start = pos
+            pos = end
+        if chunk_start is not None:
+            yield decode(text[chunk_start:])
+
+    def _decode_chunk(self, chunk: bytes) -> str:
+        """
+        Decode a chunk found by :meth:`iter_chunks`.
+
+        Args:
+            chunk: The raw bytes of the chunk, including its final line ending.
+
+        Returns:
+            The chunk text, with LF line endings and no trailing newline.
+
+        """
+        return (
+            chunk.decode("utf-8")
+            .replace("\r\n", "\n")
+            .replace("\r", "\n")
+            .removesuffix("\n")
+        )
+
     def is_heading_chunk(self, lines: str) -> bool:
         """
         Check if a text chunk is a heading chunk.
@@ -316,7 +400,38 @@ class PlayImporter:
             True if line is an underline, False otherwise.
 
         """
-        return line and all(c == "=" for c in line)
+        # ``str.strip`` removes every "=" in one C-level pass, so anything left
+        # over means the line contains some other character.
+        return bool(line) and not line.strip("=")
+
+    def extract_heading(self, lines: list[str]) -> ActData | SceneData | None:
+        """
+        Check if a text chunk is a PROLOGUE, ACT or Scene marker.
+
+        This is what :meth:`parse` uses instead of calling
+        :meth:`extract_prologue`, :meth:`extract_act` and :meth:`extract_scene`
+        in turn, so that :meth:`is_heading_chunk` only runs once per chunk.
+
+        Args:
+            lines: List of lines to check.
+
+        Returns:
+            ActData if chunk is a PROLOGUE or ACT marker, SceneData if chunk
+            is a Scene marker, None otherwise.
+
+        """
+        if not self.is_heading_chunk(lines):
+            return None
+        heading = lines[0].strip()
+        # A cheap prefix check rejects any other underlined line before we try
+        # each of the heading patterns in turn.
+        if not heading.upper().startswith(self.HEADING_PREFIXES):
+            return None
+        return (
+            self._prologue_from_heading(heading)
+            or self._act_from_heading(heading)
+            or self._scene_from_heading(heading)
+        )
 
     def extract_prologue(self, lines: list[str]) -> ActData | None:
         """
@@ -340,12 +455,7 @@ class PlayImporter:
         """
         if not self.is_heading_chunk(lines):
             return None
-        line = lines[0].strip()
-        if line.upper() == "PROLOGUE":
-            act = ActData(name="Prologue", order=0)
-            act.scenes.append(SceneData(name="Prologue", order=0))
-            return act
-        return None
+        return self._prologue_from_heading(lines[0].strip())
 
     def extract_act(self, lines: list[str]) -> ActData | None:
         """
@@ -369,10 +479,7 @@ class PlayImporter:
         """
         if not self.is_heading_chunk(lines):
             return None
-        line = lines[0].strip().upper()
-        if act_match := self.ACT_MARKER_REGEX.search(line):
-            return ActData(name=line, order=int(act_match.group(1)))
-        return None
+        return self._act_from_heading(lines[0].strip())
 
     def extract_scene(self, lines: list[str]) -> SceneData | None:
         """
@@ -396,9 +503,54 @@ class PlayImporter:
         """
         if not self.is_heading_chunk(lines):
             return None
-        line = lines[0].strip()
-        if scene_match := self.SCENE_MARKER_REGEX.search(line):
-            return SceneData(name=line, order=int(scene_match.group(1)))
+        return self._scene_from_heading(lines[0].strip())
+
+    def _prologue_from_heading(self, heading: str) -> ActData | None:
+        """
+        Build the Prologue act if ``heading`` is a PROLOGUE heading name.
+
+        Args:
+            heading: The stripped first line of a heading chunk.
+
+        Returns:
+            ActData if heading is "PROLOGUE", None otherwise.
+
+        """
+        if heading.upper() == "PROLOGUE":
+            act = ActData(name="Prologue", order=0)
+            act.scenes.append(SceneData(name="Prologue", order=0))
+            return act
+        return None
+
+    def _act_from_heading(self, heading: str) -> ActData | None:
+        """
+        Build an act if ``heading`` is an ACT heading name.
+
+        Args:
+            heading: The stripped first line of a heading chunk.
+
+        Returns:
+            ActData if heading is "ACT", a space and a number, None otherwise.
+
+        """
+        heading = heading.upper()
+        if act_match := self.ACT_MARKER_REGEX.search(heading):
+            return ActData(name=sys.intern(heading), order=int(act_match.group(1)))
+        return None
+
+    def _scene_from_heading(self, heading: str) -> SceneData | None:
+        """
+        Build a scene if ``heading`` is a Scene heading name.
+
+        Args:
+            heading: The stripped first line of a heading chunk.
+
+        Returns:
+            SceneData if heading is "Scene", a space and a number, None otherwise.
+
+        """
+        if scene_match := self.SCENE_MARKER_REGEX.search(heading):
+            return SceneData(name=sys.intern(heading), order=int(scene_match.group(1)))
         return None
 
     def extract_stage_direction(self, chunk: str) -> SpeechData | None:
@@ -428,6 +580,10 @@ class PlayImporter:
             True if line is stage direction, False otherwise.
 
         """
+        # The block has to start at the beginning of a line, so skip the regex
+        # search entirely for the many chunks with no line starting with "[".
+        if not chunk.startswith("[") and "\n[" not in chunk:
+            return None
         if match := self.STAGE_DIRECTION_BLOCK_REGEX.search(chunk):
             return SpeechData(
                 speaker="Stage Directions",
@@ -552,13 +708,14 @@ class PlayImporter:
             SpeechData if chunk is a speech, None otherwise.
 
         """  # noqa: D301, E501
-        # Remove trailing spaces from all lines
-        lines = [line.rstrip() for line in chunk.splitlines()]
-        if not lines:
-            return None
-
-        first_line = lines[0]
-        if not first_line.strip():
+        lines = iter(chunk.splitlines())
+        # Remove trailing spaces from the first line; a chunk with no lines at
+        # all yields an empty first line and is rejected below
+        first_line = next(lines, "").rstrip()
+        # Speaker names are all caps, so a first line that doesn't start with
+        # an uppercase letter (including a blank or indented one) can't be a
+        # speech.  This is much cheaper than running the regex below on it.
+        if not "A" <= first_line[:1] <= "Z":
             return None
 
         # Regex: Match leading all-caps words (optionally multi-word), then
@@ -567,17 +724,17 @@ class PlayImporter:
         if not match:
             return None
 
-        speaker = match.group(1)
+        # Each speaker has many speeches, so intern the name to share one
+        # string between them instead of keeping a copy per speech.
+        speaker = sys.intern(match.group(1))
         first_line_speech = (match.group(2) or "").strip()
 
-        speech_lines = []
-        if first_line_speech:
-            speech_lines.append(first_line_speech)
-        # Remaining lines are always part of the speech text (if present)
-        if len(lines) > 1:
-            speech_lines.extend(line for line in lines[1:] if line.strip() != "")
-
-        speech_text = "\n".join(speech_lines)
+        # Remaining lines are always part of the speech text (if present).
+        # Strip trailing spaces, drop blank lines and join everything in a
+        # single pass rather than building intermediate lists of lines.
+        speech_text = "\n".join(
+            filter(None, chain((first_line_speech,), map(str.rstrip, lines)))
+        )
         if not speech_text:
             return None
 
@@ -613,15 +770,15 @@ class PlayImporter:
             SpeechData object for the bare text.
 
         """
-        # Look through state.current_scene.speeches in reverse order, looking for
-        # the last speech that has a speaker name that is not "Stage Directions".
-        for speech in reversed(state.current_scene.speeches):
-            if speech.speaker and speech.speaker != "Stage Directions":
-                return SpeechData(
-                    speaker=speech.speaker,
-                    text=chunk.strip(),
-                    order=0,
-                )
+        # The state tracks the last speaker in the current scene that was not
+        # "Stage Directions" as speeches are added, so we don't need to walk
+        # back through the scene's speeches to find it.
+        if state.last_speaker:
+            return SpeechData(
+                speaker=state.last_speaker,
+                text=chunk.strip(),
+                order=0,
+            )
         msg = f"No speaker found for chunk: {chunk.strip()}"
         raise ValueError(msg)
 
@@ -637,51 +794,139 @@ class PlayImporter:
             and a boolean indicating if a new play was created.
 
         """
-        # Get or create play
-        play, created = Play.objects.get_or_create(title=play_data.title)
-        if not created:
-            # Delete existing acts and related data
-            play.acts.all().delete()
-
-        # Create acts
-        for act_data in play_data.acts:
-            act = Act.objects.create(
-                play=play, name=act_data.name, order=act_data.order
+        # Do the whole import in one transaction, so that replacing an existing
+        # play is all-or-nothing and the inserts commit once rather than once
+        # per statement.
+        with transaction.atomic():
+            # Get or create play
+            play, created = Play.objects.get_or_create(title=play_data.title)
+            if not created:
+                # Delete existing acts and related data
+                play.acts.all().delete()
+
+            # Create everything with one bulk insert per model rather than one
+            # INSERT per row.  Not every database backend (MySQL, notably) sets
+            # primary keys on bulk created objects, so parents are looked back
+            # up by their unique orders before creating their children.
+
+            # Create speakers
+            speaker_names = self._speaker_names(play_data)
+            Speaker.objects.bulk_create(
+                [Speaker(name=name) for name in speaker_names], ignore_conflicts=True
+            )
+            speakers = Speaker.objects.filter(name__in=speaker_names).in_bulk(
+                field_name="name"
             )
 
-            # Create scenes
-            for scene_data in act_data.scenes:
-                scene = Scene.objects.create(
-                    act=act, name=scene_data.name, order=scene_data.order
-                )
-
-                # Create speeches
-                for speech_data in scene_data.speeches:
-                    speaker, _ = Speaker.objects.get_or_create(name=speech_data.speaker)
-                    Speech.objects.create(
-                        speaker=speaker,
-                        scene=scene,
-                        text=speech_data.text,
-                        order=speech_data.order,
+            # Create acts
+            Act.objects.bulk_create(
+                [
+                    Act(play=play, name=act_data.name, order=act_data.order)
+                    for act_data in play_data.acts
+                ]
+            )
+            acts = {act.order: act for act in play.acts.all()}
+
+            # Create scenes.  bulk_create() doesn't call Scene.save(), so we
+            # have to set the play ourselves.
+            Scene.objects.bulk_create(
+                [
+                    Scene(
+                        play=play,
+                        act=acts[act_data.order],
+                        name=scene_data.name,
+                        order=scene_data.order,
                     )
+                    for act_data in play_data.acts
+                    for scene_data in act_data.scenes
+                ]
+            )
+            scenes = {(scene.act_id, scene.order): scene for scene in play.scenes.all()}
+
+            # Create speeches
+            speeches = [
+                Speech(
+                    speaker=speakers[speech_data.speaker],
+                    scene=scenes[(acts[act_data.order].pk, scene_data.order)],
+                    text=speech_data.text,
+                    order=speech_data.order,
+                )
+                for act_data in play_data.acts
+                for scene_data in act_data.scenes
+                for speech_data in scene_data.speeches
+            ]
+            Speech.objects.bulk_create(speeches)
         return play, created
 
+    def _speaker_names(self, play_data: PlayData) -> set[str]:
+        """
+        Collect the names of everyone who speaks in the play.
+
+        Args:
+            play_data: Parsed play data structure.
+
+        Returns:
+            The set of unique speaker names.
+
+        """
+        return {
+            speech_data.speaker
+            for act_data in play_data.acts
+            for scene_data in act_data.scenes
+            for speech_data in scene_data.speeches
+        }
+
     def generate_fixture(self, output_fixture_path: Path) -> None:
         """
         Generate Django fixture file from parsed play data.
 
+        The fixture is a JSON array, unless the path ends in ``.jsonl``, in
+        which case it is JSON Lines instead.  ``loaddata`` reads both, choosing
+        the format from the file extension.
+
         Args:
             output_fixture_path: Path where fixture file should be written.
 
         """
         play_data = self.parse()
-        fixture_data = []
+        output_path_obj = Path(output_fixture_path)
+        output_path_obj.parent.mkdir(parents=True, exist_ok=True)
+        write = (
+            self.write_fixture_lines
+            if output_path_obj.suffix == ".jsonl"
+            else self.write_fixture
+        )
+        with output_path_obj.open("w", encoding="utf-8") as f:
+            write(self.iter_fixture_entries(play_data), f)
+
+    def iter_fixture_entries(self, play_data: PlayData) -> Iterator[dict[str, Any]]:
+        """
+        Generate the Django fixture entries for parsed play data.
+
+        Primary keys are allocated after the highest existing primary key for
+        each model, and speakers that already exist in the database are reused
+        rather than added to the fixture.
+
+        Args:
+            play_data: Parsed play data structure.
+
+        Yields:
+            Each fixture entry, parents before the children that refer to them.
+
+        """
         try:
             play_pk_counter = Play.objects.aggregate(Max("pk"))["pk__max"] or 0
             speech_pk_counter = Speech.objects.aggregate(Max("pk"))["pk__max"] or 1
             act_pk_counter = Act.objects.aggregate(Max("pk"))["pk__max"] or 1
             scene_pk_counter = Scene.objects.aggregate(Max("pk"))["pk__max"] or 1
             speaker_pk_counter = Speaker.objects.aggregate(Max("pk"))["pk__max"] or 1
+            # Look up all the speakers that already exist at once, rather than
+            # querying for each new speaker as we come to it.
+            speaker_pks = dict(
+                Speaker.objects.filter(
+                    name__in=self._speaker_names(play_data)
+                ).values_list("name", "pk")
+            )
         except django.db.utils.OperationalError:
             logger.warning("play_importer.generate_fixture.no-database")
             play_pk_counter = 1
@@ -689,6 +934,7 @@ class PlayImporter:
             act_pk_counter = 1
             scene_pk_counter = 1
             speaker_pk_counter = 1
+            speaker_pks = {}
         else:
             play_pk_counter += 1
             speech_pk_counter += 1
@@ -707,96 +953,114 @@ class PlayImporter:
 
         # Create play
         play_pk = play_pk_counter
-        fixture_data.append(
-            {
-                "model": "core.play",
-                "pk": play_pk,
-                "fields": {"title": play_data.title},
-            }
-        )
+        yield {
+            "model": "core.play",
+            "pk": play_pk,
+            "fields": {"title": play_data.title},
+        }
 
         # Track pks for foreign keys
         act_pks = {}
         scene_pks = {}
-        speaker_pks = {}
 
         # Create acts
         for act_data in play_data.acts:
             act_pk = act_pk_counter
             act_pks[(act_data.name, act_data.order)] = act_pk
-            fixture_data.append(
-                {
-                    "model": "core.act",
-                    "pk": act_pk,
-                    "fields": {
-                        "play": play_pk,
-                        "name": act_data.name,
-                        "order": act_data.order,
-                    },
-                }
-            )
+            yield {
+                "model": "core.act",
+                "pk": act_pk,
+                "fields": {
+                    "play": play_pk,
+                    "name": act_data.name,
+                    "order": act_data.order,
+                },
+            }
             act_pk_counter += 1
 
             # Create scenes
             for scene_data in act_data.scenes:
                 scene_pk = scene_pk_counter
                 scene_pks[(act_pk, scene_data.name, scene_data.order)] = scene_pk
-                fixture_data.append(
-                    {
-                        "model": "core.scene",
-                        "pk": scene_pk,
-                        "fields": {
-                            "play": play_pk,
-                            "act": act_pk,
-                            "name": scene_data.name,
-                            "order": scene_data.order,
-                        },
-                    }
-                )
+                yield {
+                    "model": "core.scene",
+                    "pk": scene_pk,
+                    "fields": {
+                        "play": play_pk,
+                        "act": act_pk,
+                        "name": scene_data.name,
+                        "order": scene_data.order,
+                    },
+                }
                 scene_pk_counter += 1
 
                 # Create speeches
                 for speech_data in scene_data.speeches:
                     speaker_name = speech_data.speaker
-                    if speaker_name not in speaker_pks:
-                        try:
-                            speaker = Speaker.objects.get(name=speaker_name)
-                        except Speaker.DoesNotExist:
-                            speaker_pk = speaker_pk_counter
-                            fixture_data.append(
-                                {
-                                    "model": "core.speaker",
-                                    "pk": speaker_pk,
-                                    "fields": {"name": speaker_name},
-                                }
-                            )
-                            speaker_pk_counter += 1
-                        else:
-                            speaker_pk = speaker.pk
-                        speaker_pks[speaker_name] = speaker_pk
-                    else:
-                        speaker_pk = speaker_pks[speaker_name]
+                    # One dict lookup for speakers we've already seen or that
+                    # are already in the database, which is almost every speech.
+                    if (speaker_pk := speaker_pks.get(speaker_name)) is None:
+                        speaker_pk = speaker_pks[speaker_name] = speaker_pk_counter
+                        yield {
+                            "model": "core.speaker",
+                            "pk": speaker_pk,
+                            "fields": {"name": speaker_name},
+                        }
+                        speaker_pk_counter += 1
 
                     speech_pk = speech_pk_counter
-                    fixture_data.append(
-                        {
-                            "model": "core.speech",
-                            "pk": speech_pk,
-                            "fields": {
-                                "speaker": speaker_pk,
-                                "scene": scene_pk,
-                                "text": speech_data.text,
-                                "order": speech_data.order,
-                            },
-                        }
-                    )
+                    yield {
+                        "model": "core.speech",
+                        "pk": speech_pk,
+                        "fields": {
+                            "speaker": speaker_pk,
+                            "scene": scene_pk,
+                            "text": speech_data.text,
+                            "order": speech_data.order,
+                        },
+                    }
                     speech_pk_counter += 1
 
-        # Write fixture file
-        output_path_obj = Path(output_fixture_path)
-        output_path_obj.parent.mkdir(parents=True, exist_ok=True)
-        with output_path_obj.open("w", encoding="utf-8") as f:
-            json.dump(fixture_data, f, indent=2, ensure_ascii=False)
+    def write_fixture(self, entries: Iterable[dict[str, Any]], f: TextIO) -> None:
+        """
+        Write fixture entries to a file as a JSON array, one entry at a time.
+
+        The output is identical to ``json.dump(list(entries), f, indent=2,
+        ensure_ascii=False)``, but the entries are never all held in memory.
+
+        Args:
+            entries: The fixture entries to write.
+            f: The text file to write to.
+
+        """
+        f.write("[")
+        separator = "\n  "
+        for entry in entries:
+            f.write(separator)
+            # JSON strings can't contain raw newlines, so every newline here is
+            # a line break in the indented output that needs one more level.
+            f.write(
+                json.dumps(entry, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+            )
+            separator = ",\n  "
+        f.write("]" if separator == "\n  " else "\n]")
+
+    def write_fixture_lines(self, entries: Iterable[dict[str, Any]], f: TextIO) -> None:
+        """
+        Write fixture entries to a file as JSON Lines, one entry per line.
+
+        This is the format of Django's ``jsonl`` serializer.  Each line is a
+        whole entry, so a reader can skip the entries it doesn't want without
+        decoding them.
+
+        Args:
+            entries: The fixture entries to write.
+            f: The text file to write to.
+
+        """
+        for entry in entries:
+            f.write(json.dumps(entry, ensure_ascii=False))
+            f.write("\n")
 
 
 if __name__ == "__main__":
@@ -29,7 +29,8 @@ class Command(BaseCommand):
             type=str,
             help=(
                 "Output fixture file path (if provided, generates fixture instead of "
-                "saving to database)"
+                "saving to database).  A path ending in .jsonl gets a JSON Lines "
+                "fixture"
             ),
         )
         parser.add_argument(
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-10-14 05:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_load_play_fixtures'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='scene',
+            index=models.Index(fields=['act', 'order'], name='core_scene_act_id_7b5bc9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='speech',
+            index=models.Index(fields=['scene', 'order'], name='core_speech_scene_i_172af5_idx'),
+        ),
+    ]
@@ -65,6 +65,9 @@ class Scene(models.Model):
     class Meta:
         ordering: ClassVar[list[str]] = ["act", "order"]
         unique_together: ClassVar[list[list[str]]] = [["play", "act", "order"]]
+        #: The unique index above leads with the play, so give our default
+        #: ordering an index of its own.
+        indexes: ClassVar[list[models.Index]] = [models.Index(fields=["act", "order"])]
         verbose_name: ClassVar[str] = "scene"
         verbose_name_plural: ClassVar[str] = "scenes"
 
@@ -132,6 +135,11 @@ class Speech(models.Model):
 
     class Meta:
         ordering: ClassVar[list[str]] = ["scene", "order"]
+        #: Index our default ordering, so that a scene's speeches don't have to
+        #: be sorted after they're found.
+        indexes: ClassVar[list[models.Index]] = [
+            models.Index(fields=["scene", "order"])
+        ]
         verbose_name: ClassVar[str] = "speech"
         verbose_name_plural: ClassVar[str] = "speeches"
 
@@ -1,18 +1,29 @@
 from __future__ import annotations
 
 import logging
+import random
 import time
-from typing import TYPE_CHECKING, List, Type  # noqa: UP035
+from contextlib import contextmanager, nullcontext
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Final, Iterable, Type  # noqa: UP035
 
+from django.db.models import Prefetch
 from haystack import indexes
-from haystack.exceptions import SkipDocument
+from haystack.constants import DJANGO_CT, DJANGO_ID, ID
+from haystack.exceptions import SearchFieldError, SkipDocument
+from haystack.utils import get_model_ct
 from opensearchpy.exceptions import TransportError
+from opensearchpy.helpers import BulkIndexError, parallel_bulk
 
 from demo.core.models import Play, Speaker, Speech
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from django.db.models import Model, QuerySet
 
+    from django_haystack_opensearch.haystack import OpenSearchSearchBackend
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,6 +33,228 @@ SKIP_DOCUMENT_TEST_MODE = False
 #: This is used to test the SkipDocument exception handling in
 #: _prepare_documents_for_bulk.
 SKIP_DOCUMENT_IDS: set[int] = set()
+#: The number of threads :func:`bulk_reindex` sends bulk requests from, and so
+#: the number of batches it prepares before each round of sending.  The
+#: connection's ``pool_maxsize`` client option should be at least this large.
+REINDEX_THREAD_COUNT = 4
+#: How many times :func:`bulk_reindex` retries documents that were rate limited.
+REINDEX_MAX_RETRIES = 5
+#: The seconds :func:`bulk_reindex` waits before its first retry.
+REINDEX_INITIAL_BACKOFF = 0.5
+#: The most seconds (before jitter) :func:`bulk_reindex` waits between retries.
+REINDEX_MAX_BACKOFF = 30
+
+
+def bulk_reindex(  # noqa: PLR0913, PLR0917
+    index: indexes.SearchIndex,
+    qs: QuerySet,
+    commit: bool = True,
+    backend: OpenSearchSearchBackend | None = None,
+    skip_unchanged: bool = False,
+    upsert: bool = False,
+    values: bool = False,
+) -> None:
+    """
+    Reindex the objects in a QuerySet with a parallel bulk stream.
+
+    Rather than calling the backend's ``update()`` for one batch at a time and
+    waiting for each to finish, this reads the objects with one streaming
+    query and prepares their documents batch by batch, and sends each round of
+    :data:`REINDEX_THREAD_COUNT` batches through
+    :func:`opensearchpy.helpers.parallel_bulk`, so that several bulk requests
+    are in flight at once.  The index is refreshed once at the end, if
+    anything was indexed and ``commit`` is True.
+
+    All the database work happens on the calling thread, and ``parallel_bulk``
+    is only handed finished actions: its pool threads would otherwise run the
+    queries on database connections of their own, which can't see the
+    caller's uncommitted rows and are never closed.  So this is safe to call
+    inside ``atomic()``, for instance in a view under ``ATOMIC_REQUESTS``.
+
+    With ``values``, the documents are built from
+    ``qs.values(*index.VALUES_COLUMNS)`` rows with the index's
+    ``prepare_values()`` method, like :meth:`SpeechIndex.prepare_values`,
+    rather than from model instances with ``full_prepare()``.  That skips
+    ``prepare_<field>`` methods, template fields and ``SkipDocument``, so
+    only :func:`reindex_all` asks for it.
+
+    The bulk requests go through the backend's client, so if the connection
+    sets the ``http_compress`` client option they are sent gzipped.
+
+    Like the backend's ``update()``, this logs OpenSearch errors rather than
+    raising them if the backend is set to ``SILENTLY_FAIL``.
+
+    Args:
+        index: The search index the objects belong to.
+        qs: The objects to reindex.
+
+    Keyword Args:
+        commit: Whether to refresh the index afterwards, so that the new
+            documents are searchable.
+        backend: The index's search backend, if the caller already has it.
+        skip_unchanged: Whether to leave out documents that are already in the
+            index exactly as we would send them; see
+            :func:`changed_documents` for which documents that is safe for.
+        upsert: Whether to send the documents as updates that OpenSearch
+            skips when they wouldn't change anything; see :func:`as_upsert`.
+        values: Whether to build the documents with the index's
+            ``prepare_values()`` method.
+
+    Raises:
+        TransportError: If setting up or refreshing the index fails, and the
+            backend doesn't silently fail.
+        BulkIndexError: If any documents fail to index for anything other than
+            rate limiting, or are still rate limited after
+            :data:`REINDEX_MAX_RETRIES` retries, and the backend doesn't
+            silently fail.
+
+    """
+    if backend is None:
+        backend = index.get_backend(None)
+        if backend is None:
+            return
+    if not backend.setup_complete:
+        try:
+            backend.setup()
+        except TransportError:
+            if not backend.silently_fail:
+                raise
+            backend.log.exception("Failed to add documents to OpenSearch")
+            return
+    batch_size: int = backend.batch_size
+
+    def batches() -> Iterator[list[dict[str, Any]]]:
+        # Stream the objects from a single query rather than one LIMIT/OFFSET
+        # query per batch, and prepare them a batch at a time, so that only
+        # one batch of them is in memory at once.
+        if values:
+            # The index can build its documents from plain rows, so skip
+            # building model instances for them at all.
+            rows = qs.values(*index.VALUES_COLUMNS).iterator(chunk_size=batch_size)
+            while batch := list(islice(rows, batch_size)):
+                documents = []
+                for row in batch:
+                    document = {
+                        key: backend._from_python(value)  # noqa: SLF001
+                        for key, value in index.prepare_values(row).items()
+                    }
+                    document["_index"] = backend.index_name
+                    document["_id"] = document[ID]
+                    documents.append(document)
+                yield documents
+        else:
+            objects = qs.iterator(chunk_size=batch_size)
+            while batch := list(islice(objects, batch_size)):
+                yield backend._prepare_documents_for_bulk(index, batch)  # noqa: SLF001
+
+    def actions(documents: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        if skip_unchanged:
+            documents = changed_documents(backend, documents)
+        return list(map(as_upsert, documents)) if upsert else documents
+
+    indexed = 0
+    pending = batches()
+    try:
+        # Build each round of actions here, on the calling thread, so that
+        # parallel_bulk's threads only ever send them.  A round holds one batch
+        # for each thread, so at most that many batches are in memory at once.
+        while round_batches := list(islice(pending, REINDEX_THREAD_COUNT)):
+            # A round can have no actions at all if none of its documents have
+            # changed, but there may still be more rounds after it.
+            if round_actions := [
+                action for documents in round_batches for action in actions(documents)
+            ]:
+                indexed += _send_actions(backend, round_actions, batch_size)
+    except (TransportError, BulkIndexError):
+        if not backend.silently_fail:
+            raise
+        backend.log.exception("Failed to bulk index documents to OpenSearch")
+    # There's nothing to make visible if there was nothing to index.
+    if commit and indexed:
+        try:
+            backend.conn.indices.refresh(index=backend.index_name)
+        except TransportError:
+            if not backend.silently_fail:
+                raise
+            backend.log.exception("Failed to refresh the OpenSearch index")
+
+
+def _send_actions(
+    backend: OpenSearchSearchBackend, actions: list[dict[str, Any]], chunk_size: int
+) -> int:
+    """
+    Send bulk actions with :func:`opensearchpy.helpers.parallel_bulk`.
+
+    OpenSearch rate limits bulk indexing either by rejecting a whole request
+    with a 429, or by rejecting some of the documents in it with per-item 429
+    ``es_rejected_execution_exception`` errors.  Either way, only the
+    documents that were rejected are sent again, after an exponential backoff.
+
+    Args:
+        backend: The search backend to send the actions through.
+        actions: The bulk actions, all built already, so that the pool threads
+            do no database work.
+        chunk_size: How many actions to send in each bulk request.
+
+    Raises:
+        BulkIndexError: If any documents fail to index for anything other than
+            rate limiting, or are still rate limited after
+            :data:`REINDEX_MAX_RETRIES` retries.
+
+    Returns:
+        The number of documents indexed.
+
+    """
+    pending = {action["_id"]: action for action in actions}
+    indexed = 0
+    for attempt in range(REINDEX_MAX_RETRIES + 1):
+        if attempt:
+            # We're being rate limited, so back off before retrying.  The
+            # delay doubles on each attempt, with some jitter so that
+            # concurrent reindexes don't all retry at once.  Indexing a
+            # document again just overwrites it, so this is safe.
+            time.sleep(
+                min(REINDEX_MAX_BACKOFF, REINDEX_INITIAL_BACKOFF * 2 ** (attempt - 1))
+                + random.random()  # noqa: S311
+            )
+        rate_limited: list[dict[str, Any]] = []
+        errors: list[dict[str, Any]] = []
+        # parallel_bulk() is lazy, so we have to consume its results to
+        # actually send the documents.  With raise_on_error and
+        # raise_on_exception off, it yields a failure for each document that
+        # was rejected, or was in a request that failed, instead of raising,
+        # so that we can tell which ones to retry.
+        for ok, item in parallel_bulk(
+            backend.conn,
+            list(pending.values()),
+            thread_count=REINDEX_THREAD_COUNT,
+            chunk_size=chunk_size,
+            raise_on_error=False,
+            raise_on_exception=False,
+        ):
+            if ok:
+                indexed += 1
+                continue
+            ((_, info),) = item.items()
+            if info.get("status") == 429:  # noqa: PLR2004
+                rate_limited.append(item)
+            else:
+                errors.append(item)
+        if errors:
+            msg = f"{len(errors)} document(s) failed to index."
+            raise BulkIndexError(msg, errors)
+        if not rate_limited:
+            return indexed
+        pending = {
+            info["_id"]: pending[info["_id"]]
+            for item in rate_limited
+            for info in item.values()
+        }
+    msg = (
+        f"{len(rate_limited)} document(s) were still rate limited after "
+        f"{REINDEX_MAX_RETRIES} retries."
+    )
+    raise BulkIndexError(msg, rate_limited)
 
 
 class SpeechIndex(indexes.SearchIndex, indexes.Indexable):
@@ -62,10 +295,87 @@ class SpeechIndex(indexes.SearchIndex, indexes.Indexable):
     # Order field as integer (already existed as model field)
     order = indexes.IntegerField(model_attr="order")
 
+    #: The columns :meth:`prepare_values` builds a document from.  These are
+    #: the ``model_attr`` lookups of our fields, except for ``speech_length``,
+    #: which is computed from the text.  Keep them, :meth:`prepare_values` and
+    #: :meth:`index_queryset` in step with the fields declared above.
+    VALUES_COLUMNS: Final[tuple[str, ...]] = (
+        "id",
+        "text",
+        "order",
+        "created_date",
+        "is_soliloquy",
+        "speaker__id",
+        "speaker__name",
+        "scene__name",
+        "scene__act__name",
+        "scene__act__play__id",
+        "scene__act__play__title",
+    )
+
     def get_model(self) -> Type[Model]:
         """Return the Speech model."""
         return Speech
 
+    def prepare_values(self, row: dict[str, Any]) -> dict[str, Any]:
+        """
+        Prepare a speech for indexing from a ``values()`` row.
+
+        This gives the same data as :meth:`full_prepare` gives for the Speech
+        itself, but without having to build the Speech and its speaker, scene,
+        act and play model instances first, or resolve each field's
+        ``model_attr`` through them.  Only :func:`reindex_all` uses this, to
+        rebuild the whole index; everything else goes through
+        :meth:`full_prepare`.
+
+        This only handles fields with a plain ``model_attr``: there's no Speech
+        to pass to ``prepare_<field>`` methods or templates here, and nothing
+        can raise ``SkipDocument``.  A field that needs any of those has to be
+        prepared here by hand, or reindex_all() has to stop using this; the
+        tests check the two give the same data for every speech.
+
+        Args:
+            row: A row of ``Speech.objects.values(*VALUES_COLUMNS)``.
+
+        Raises:
+            SearchFieldError: If a field's value is None, but the field has no
+                default and isn't ``null``, as ``full_prepare()`` does.
+
+        Returns:
+            The prepared data for the speech.
+
+        """
+        content_type = get_model_ct(self.get_model())
+        row["speech_length"] = float(len(row["text"]))
+        data: dict[str, Any] = {
+            ID: f"{content_type}.{row['id']}",
+            DJANGO_CT: content_type,
+            DJANGO_ID: str(row["id"]),
+        }
+        for field in self.fields.values():
+            # The facet fields haystack adds for faceted fields have no
+            # model_attr; they're copied from their source fields below.
+            value = row[field.model_attr] if field.model_attr else None
+            if value is None:
+                if field.has_default():
+                    value = field.default
+                elif field.model_attr and not field.null:
+                    msg = (
+                        f"Speech {row['id']} combined with model_attr "
+                        f"'{field.model_attr}' returned None, but doesn't allow a "
+                        "default or null value."
+                    )
+                    raise SearchFieldError(msg)
+            data[field.index_fieldname] = field.convert(value)
+        for field in self.fields.values():
+            if facet_for := getattr(field, "facet_for", None):
+                data[field.index_fieldname] = data[
+                    self.fields[facet_for].index_fieldname
+                ]
+            if field.null and data[field.index_fieldname] is None:
+                del data[field.index_fieldname]
+        return data
+
     def index_queryset(self, using: str | None = None) -> QuerySet:  # noqa: ARG002
         """
         Used when the entire index for model is updated.
@@ -74,10 +384,25 @@ class SpeechIndex(indexes.SearchIndex, indexes.Indexable):
             using: The alias of the database to use. (unused)
 
         Returns:
-            QuerySet of all Speech objects.
+            QuerySet of all Speech objects, with the speaker, scene, act and
+            play each speech's fields are prepared from joined in, and only the
+            columns our fields use selected.
 
         """
-        return self.get_model().objects.all()
+        return (
+            self.get_model()
+            .objects.select_related("speaker", "scene__act__play")
+            .only(
+                "text",
+                "order",
+                "created_date",
+                "is_soliloquy",
+                "speaker__name",
+                "scene__name",
+                "scene__act__name",
+                "scene__act__play__title",
+            )
+        )
 
     def prepare_skip_test(self, obj: Speech) -> str:
         """
@@ -103,40 +428,28 @@ class SpeechIndex(indexes.SearchIndex, indexes.Indexable):
             raise SkipDocument(msg)
         return ""
 
-    def reindex_play(self, play: Play) -> None:
+    def reindex_play(
+        self, play: Play, backend: OpenSearchSearchBackend | None = None
+    ) -> None:
         """
         Reindex all speeches for a particular play.
 
         Args:
             play: The play whose speeches we want to reindex.
 
+        Keyword Args:
+            backend: Our search backend, if the caller already has it.
+
         """
-        qs = Speech.objects.filter(scene__act__play=play)
-        backend = self.get_backend(None)
-        if backend is not None:
-            batch_size: int = backend.batch_size
-            total: int = qs.count()
-            # We need to update the index in batches because we can run into
-            # backend transport errors if we try to update too many documents
-            # at once.
-            for start in range(0, total, batch_size):
-                end = min(start + batch_size, total)
-                while True:
-                    try:
-                        backend.update(self, qs[start:end])
-                    except TransportError as e:  # noqa: PERF203
-                        # Check the status_code from the exception to see if we
-                        # can recover from it.
-                        if (
-                            hasattr(e, "status_code") and e.status_code == 429  # noqa: PLR2004
-                        ):
-                            # We're being rate limited, so sleep and retry.
-                            time.sleep(5)
-                        else:
-                            # Re-raise if it's not a rate limit error
-                            raise
-                    else:
-                        break
+        # Re-running this over a play whose speeches haven't changed is common,
+        # so let OpenSearch skip the unchanged ones, without us fetching their
+        # (large) texts back to compare them first.
+        bulk_reindex(
+            self,
+            self.index_queryset().filter(scene__act__play=play),
+            backend=backend,
+            upsert=True,
+        )
 
 
 class SpeakerIndex(indexes.SearchIndex, indexes.Indexable):
@@ -153,56 +466,130 @@ class SpeakerIndex(indexes.SearchIndex, indexes.Indexable):
     #: The play field for faceted search
     play = indexes.MultiValueField(faceted=True)
 
+    #: The act names, scene names and play titles of every speaker's speeches,
+    #: by speaker id, while :meth:`cached_facets` is in effect.
+    facet_cache: dict[int, tuple[set[str], set[str], set[str]]] | None = None
+
     def get_model(self) -> Type[Model]:
         """Return the Speaker model."""
         return Speaker
 
-    def prepare_act(self, obj: Speaker) -> List[str]:
+    @contextmanager
+    def cached_facets(self) -> Iterator[None]:
         """
-        Prepare act names for indexing.
+        Load the facets of every speaker at once, for a full reindex.
+
+        All speeches are read in one query, and their act names, scene names
+        and play titles are folded into :attr:`facet_cache`, which
+        :meth:`prepare` then reads from instead of each speaker's speeches.
+        Speakers prepared while this is in effect thus need no speeches
+        prefetched.  The cache is dropped again on exit.
+
+        Yields:
+            Nothing; the cache is loaded for the duration of the block.
 
-        Returns all act names where this speaker has speeches (across all plays).
+        """
+        cache: dict[int, tuple[set[str], set[str], set[str]]] = {}
+        rows = Speech.objects.values_list(
+            "speaker_id",
+            "scene__act__name",
+            "scene__name",
+            "scene__act__play__title",
+        ).iterator()
+        for speaker_id, act, scene, play in rows:
+            facets = cache.get(speaker_id)
+            if facets is None:
+                facets = cache[speaker_id] = (set(), set(), set())
+            facets[0].add(act)
+            facets[1].add(scene)
+            facets[2].add(play)
+        self.facet_cache = cache
+        try:
+            yield
+        finally:
+            self.facet_cache = None
+
+    def with_speeches(self, qs: QuerySet) -> QuerySet:
+        """
+        Prefetch the speeches our facet fields are prepared from.
+
+        All the speeches of a batch of speakers, along with their scenes, acts
+        and plays, are fetched in one extra query, rather than querying for
+        the speeches of each speaker in turn.
 
         Args:
-            obj: The Speaker object being indexed.
+            qs: A QuerySet of Speaker objects.
 
         Returns:
-            List of unique act names.
+            The QuerySet, with each speaker's speeches prefetched into
+            ``indexed_speeches``.
 
         """
-        return list(obj.speeches.values_list("scene__act__name", flat=True).distinct())
+        return qs.prefetch_related(
+            Prefetch(
+                "speeches",
+                queryset=Speech.objects.select_related("scene__act__play").only(
+                    "speaker",
+                    "scene__name",
+                    "scene__act__name",
+                    "scene__act__play__title",
+                ),
+                to_attr="indexed_speeches",
+            )
+        )
 
-    def prepare_scene(self, obj: Speaker) -> List[str]:
+    def get_speeches(self, obj: Speaker) -> Iterable[Speech]:
         """
-        Prepare scene names for indexing.
-
-        Returns all scene names where this speaker has speeches (across all plays).
+        Get the speeches of a speaker, with their scenes, acts and plays.
 
         Args:
             obj: The Speaker object being indexed.
 
         Returns:
-            List of unique scene names.
+            The speeches prefetched by :meth:`with_speeches`, or if ``obj``
+            didn't come from such a QuerySet, a QuerySet of its speeches.
 
         """
-        return list(obj.speeches.values_list("scene__name", flat=True).distinct())
+        speeches = getattr(obj, "indexed_speeches", None)
+        if speeches is None:
+            speeches = obj.speeches.select_related("scene__act__play")
+        return speeches
 
-    def prepare_play(self, obj: Speaker) -> List[str]:
+    def prepare(self, obj: Speaker) -> dict[str, Any]:
         """
-        Prepare play titles for indexing.
+        Prepare a speaker for indexing.
 
-        Returns all play titles where this speaker has speeches.
+        The act, scene and play facet fields are all built from the speaker's
+        speeches, so they are filled in together here in one pass over the
+        speeches rather than by a ``prepare_<field>`` method for each.  Inside
+        :meth:`cached_facets`, they are looked up in :attr:`facet_cache`
+        instead.
 
         Args:
             obj: The Speaker object being indexed.
 
         Returns:
-            List of unique play titles.
+            The prepared data, with the unique act names, scene names and play
+            titles where this speaker has speeches (across all plays), each
+            in sorted order.
 
         """
-        return list(
-            obj.speeches.values_list("scene__act__play__title", flat=True).distinct()
-        )
+        data = super().prepare(obj)
+        if self.facet_cache is not None:
+            acts, scenes, plays = self.facet_cache.get(obj.pk, ((), (), ()))
+        else:
+            acts, scenes, plays = set(), set(), set()
+            for speech in self.get_speeches(obj):
+                scene = speech.scene
+                acts.add(scene.act.name)
+                scenes.add(scene.name)
+                plays.add(scene.act.play.title)
+        # Sort the values, so that the same facets always make the same
+        # document; see changed_documents().
+        data["act"] = sorted(acts)
+        data["scene"] = sorted(scenes)
+        data["play"] = sorted(plays)
+        return data
 
     def index_queryset(self, using: str | None = None) -> QuerySet:  # noqa: ARG002
         """
@@ -212,12 +599,14 @@ class SpeakerIndex(indexes.SearchIndex, indexes.Indexable):
             using: The alias of the database to use. (unused)
 
         Returns:
-            QuerySet of all Speaker objects.
+            QuerySet of all Speaker objects, with their speeches prefetched.
 
         """
-        return self.get_model().objects.all()
+        return self.with_speeches(self.get_model().objects.all())
 
-    def reindex_play(self, play: Play) -> None:
+    def reindex_play(
+        self, play: Play, backend: OpenSearchSearchBackend | None = None
+    ) -> None:
         """
         Reindex all speakers who have speeches in a particular play.
 
@@ -227,33 +616,22 @@ class SpeakerIndex(indexes.SearchIndex, indexes.Indexable):
         Args:
             play: The play whose speakers we want to reindex.
 
+        Keyword Args:
+            backend: Our search backend, if the caller already has it.
+
         """
-        qs = Speaker.objects.filter(speeches__scene__act__play=play).distinct()
-        backend = self.get_backend(None)
-        if backend is not None:
-            batch_size: int = backend.batch_size
-            total: int = qs.count()
-            # We need to update the index in batches because we can run into
-            # backend transport errors if we try to update too many documents
-            # at once.
-            for start in range(0, total, batch_size):
-                end = min(start + batch_size, total)
-                while True:
-                    try:
-                        backend.update(self, qs[start:end])
-                    except TransportError as e:  # noqa: PERF203
-                        # Check the status_code from the exception to see if we
-                        # can recover from it.
-                        if (
-                            hasattr(e, "status_code") and e.status_code == 429  # noqa: PLR2004
-                        ):
-                            # We're being rate limited, so sleep and retry.
-                            time.sleep(5)
-                        else:
-                            # Re-raise if it's not a rate limit error
-                            raise
-                    else:
-                        break
+        # Select the speakers through a subquery of the play's speeches, rather
+        # than joining to them, so that there are no duplicate speakers for the
+        # database to remove with a DISTINCT.
+        speaker_ids = Speech.objects.filter(scene__act__play=play).values("speaker")
+        # Most of these speakers' facets don't change just because this play
+        # did, so only send the speakers whose documents actually differ.
+        bulk_reindex(
+            self,
+            self.with_speeches(Speaker.objects.filter(pk__in=speaker_ids)),
+            backend=backend,
+            skip_unchanged=True,
+        )
 
 
 class PlayIndex(indexes.SearchIndex, indexes.Indexable):
@@ -298,23 +676,234 @@ class PlayIndex(indexes.SearchIndex, indexes.Indexable):
         return self.get_model().objects.all()
 
 
-def reindex_all() -> None:
+def changed_documents(
+    backend: OpenSearchSearchBackend, documents: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
     """
-    Reindex all plays in the database.
+    Drop the documents that are already in the index exactly as they are.
 
-    This function iterates through all Play objects and calls reindex_play()
-    on both SpeechIndex and SpeakerIndex for each play.
+    The indexed versions of all the documents are fetched with one ``mget``
+    request, and only the documents that are new or differ from them are
+    kept.  That costs an extra round trip per batch, but saves OpenSearch
+    re-indexing documents that haven't changed.  If the ``mget`` fails, all
+    the documents are kept, so the worst case is indexing them anyway.
 
-    Errors are logged but do not stop the reindexing process.
+    The comparison is with the ``_source`` that OpenSearch sends back, which
+    is our document as it went through JSON.  So this is only suitable for
+    documents whose values are all strings, or lists of strings in a fixed
+    order, like :class:`SpeakerIndex`'s: numbers, dates and the like may come
+    back formatted differently than we prepare them, and then always look
+    changed.
+
+    Args:
+        backend: The search backend the documents are for.
+        documents: Bulk index actions, as built by :func:`bulk_reindex`.
+
+    Returns:
+        The documents that need to be (re)indexed.
 
     """
-    speech_index = SpeechIndex()
-    speaker_index = SpeakerIndex()
+    if not documents:
+        return documents
+    try:
+        response = backend.conn.mget(
+            index=backend.index_name,
+            body={"ids": [document["_id"] for document in documents]},
+        )
+    except TransportError:
+        logger.exception(
+            "Could not fetch the indexed documents from OpenSearch index %s to "
+            "compare with; sending them all",
+            backend.index_name,
+        )
+        return documents
+    indexed = {
+        doc["_id"]: doc["_source"] for doc in response["docs"] if doc.get("found")
+    }
+    return [
+        document
+        for document in documents
+        if _normalize_document(indexed.get(document["_id"], {}))
+        != _normalize_document(document)
+    ]
+
+
+def as_upsert(document: dict[str, Any]) -> dict[str, Any]:
+    """
+    Turn a bulk index action into an update action that upserts the document.
+
+    With ``detect_noop``, OpenSearch compares the update with the document it
+    already has, and skips the write entirely if nothing would change.  Unlike
+    :func:`changed_documents`, this needs no extra round trip for the stored
+    documents, which matters when they are large.  The update replaces each
+    field we send, but leaves alone any field we don't, so this is only
+    suitable for indexes whose documents always have every field.
+
+    Args:
+        document: A bulk index action, as built by :func:`bulk_reindex`.
+
+    Returns:
+        The equivalent update action.
+
+    """
+    return {
+        "_op_type": "update",
+        "_index": document["_index"],
+        "_id": document["_id"],
+        "doc": _normalize_document(document),
+        "doc_as_upsert": True,
+        "detect_noop": True,
+    }
+
+
+def _normalize_document(document: dict[str, Any]) -> dict[str, Any]:
+    """
+    Put a document into a form we can compare with another version of it.
+
+    The bulk metadata is dropped.  Multi-valued fields are compared as they
+    are, so indexes must prepare their values in a deterministic order, as
+    :meth:`SpeakerIndex.prepare` does.
 
-    for play in Play.objects.all():
+    Args:
+        document: A document's source, or a bulk index action.
+
+    Returns:
+        The comparable document.
+
+    """
+    return {
+        key: value for key, value in document.items() if key not in ("_index", "_id")
+    }
+
+
+@contextmanager
+def bulk_indexing_settings(backend: OpenSearchSearchBackend) -> Iterator[None]:
+    """
+    Tune the backend's index for a full rebuild while the context is active.
+
+    Periodic refreshes and replica copies are turned off, so that OpenSearch
+    only has to write each document once, and doesn't keep building new
+    segments while we're still sending documents.  The index's previous
+    settings are put back afterwards (or reset to the defaults, if they were
+    not set), even if the body of the context raises, and the index is
+    refreshed once so that everything we indexed becomes searchable.  If the
+    index can't be tuned in the first place, that is logged, and the body runs
+    with the index's own settings.
+
+    Args:
+        backend: The search backend whose index we're rebuilding.
+
+    Raises:
+        TransportError: If the index can't be set up and the backend doesn't
+            silently fail, or the settings can't be restored, or the index
+            can't be refreshed.  A failure to restore them is logged.
+
+    Yields:
+        Nothing; the settings are restored when the context exits.
+
+    """
+    if not backend.setup_complete:
+        try:
+            backend.setup()
+        except TransportError:
+            if not backend.silently_fail:
+                raise
+            backend.log.exception("Failed to add documents to OpenSearch")
+    indices = backend.conn.indices
+    index_name: str = backend.index_name
+    restore: dict[str, Any] | None = None
+    if backend.setup_complete:
+        try:
+            # The response is keyed by the concrete index name, which isn't
+            # index_name if that is an alias.
+            response = indices.get_settings(index=index_name)
+            previous = next(iter(response.values()))["settings"]["index"]
+            indices.put_settings(
+                index=index_name,
+                body={"index": {"refresh_interval": "-1", "number_of_replicas": 0}},
+            )
+        except Exception:
+            # The tuning only makes the rebuild faster, so rebuild without it.
+            logger.exception(
+                "Could not tune OpenSearch index %s for bulk indexing; "
+                "reindexing with its own settings",
+                index_name,
+            )
+        else:
+            restore = {
+                "refresh_interval": previous.get("refresh_interval"),
+                "number_of_replicas": previous.get("number_of_replicas"),
+            }
+    try:
+        yield
+    finally:
         try:
-            speech_index.reindex_play(play)
-            speaker_index.reindex_play(play)
-        except Exception:  # noqa: PERF203
-            # Log error but continue with next play
-            logger.exception("Error reindexing play %s", play.title)
+            if restore is not None:
+                indices.put_settings(index=index_name, body={"index": restore})
+        except Exception:
+            # Otherwise the index is silently left never refreshing, and with
+            # no replicas.
+            logger.exception(
+                "Could not restore the settings of OpenSearch index %s after "
+                "reindexing: it still has refresh_interval -1 and "
+                "number_of_replicas 0, and should be set back to %s",
+                index_name,
+                restore,
+            )
+            raise
+        finally:
+            if backend.setup_complete:
+                indices.refresh(index=index_name)
+
+
+def reindex_all() -> None:
+    """
+    Reindex all speeches and speakers in the database.
+
+    Rather than calling reindex_play() on both SpeechIndex and SpeakerIndex for
+    each play, this streams each index's whole :meth:`index_queryset` through
+    :func:`bulk_reindex` at once, so that the documents for every play go out in
+    one bulk stream per index, and each speaker is indexed only once no matter
+    how many plays they appear in.  The speakers' facets are all loaded up
+    front in one query with :meth:`SpeakerIndex.cached_facets`, rather than
+    prefetching speeches for each chunk of speakers.  The index is tuned for
+    bulk loading while this runs; see :func:`bulk_indexing_settings`.
+
+    The only concurrency is in the bulk requests themselves: both indexes are
+    read and prepared one after the other on the calling thread, on its
+    database connection.  So this sees, and is safe to run inside, the
+    caller's transaction, like the rebuild action in the index admin view,
+    which runs in the request's ``ATOMIC_REQUESTS`` transaction.
+
+    Errors are logged but do not stop the reindexing process.  Neither does
+    failing to tune the index's settings, which just means reindexing with its
+    own; if they can't be put back afterwards, that is logged too.
+
+    """
+    speech_index = SpeechIndex()
+    speaker_index = SpeakerIndex()
+    # Both indexes use the default connection, so look its backend up once.
+    backend = speech_index.get_backend(None)
+    # Speeches are most of the index, so build theirs from values() rows to
+    # save building every speech's model instances; see
+    # SpeechIndex.prepare_values().
+    jobs = (
+        (speech_index, speech_index.index_queryset(), nullcontext(), True),
+        (speaker_index, Speaker.objects.all(), speaker_index.cached_facets(), False),
+    )
+    try:
+        with bulk_indexing_settings(backend) if backend is not None else nullcontext():
+            for index, qs, context, values in jobs:
+                try:
+                    # bulk_indexing_settings() refreshes the index once we're done
+                    with context:
+                        bulk_reindex(
+                            index, qs, commit=False, backend=backend, values=values
+                        )
+                except Exception:  # noqa: PERF203
+                    # Log error but continue with the next index
+                    logger.exception("Error reindexing %s", type(index).__name__)
+    except Exception:
+        # Setting up the index, putting its settings back, or refreshing it
+        # failed.
+        logger.exception("Error tuning the search index for reindexing")
@@ -1,71 +1,90 @@
+import copy
+import functools
 import json
 import tempfile
 from contextlib import suppress
 from datetime import date, datetime
 from pathlib import Path
+from typing import Any, Final
+from unittest import mock
 
 import pytest
+from django.contrib.admin import site
 from django.core.management import call_command
 from django.core.management.base import CommandError
+from django.db import transaction
+from django.db.models import Count, Max, Q
 from haystack import connections
+from haystack.exceptions import SearchFieldError
 from haystack.query import SearchQuerySet
+from opensearchpy.exceptions import TransportError
+from opensearchpy.helpers import BulkIndexError
 
-from demo.core.importers import PlayImporter
+from demo.core.admin import LabelRelatedFieldListFilter
+from demo.core.importers import PlayData, PlayImporter
 from demo.core.models import Act, Play, Scene, Speaker, Speech
-from demo.core.search_indexes import PlayIndex, SpeakerIndex, SpeechIndex, reindex_all
+from demo.core.search_indexes import (
+    REINDEX_MAX_RETRIES,
+    PlayIndex,
+    SpeakerIndex,
+    SpeechIndex,
+    as_upsert,
+    bulk_indexing_settings,
+    bulk_reindex,
+    reindex_all,
+)
 
 # Helper functions for creating test play files
 
 
-def create_temp_play_file(content: str) -> Path:
-    """Create a temporary play text file with the given content."""
-    fd, path = tempfile.mkstemp(suffix=".txt", text=True)
-    with open(fd, "w", encoding="utf-8") as f:
-        f.write(content)
-    return Path(path)
+@functools.cache
+def _cached_parse(content: str, title: str) -> PlayData:
+    """Parse play text, once for each distinct content and title."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        play_file = Path(tmp_dir) / "play.txt"
+        play_file.write_text(content, encoding="utf-8")
+        return PlayImporter(input_file_path=play_file, title=title).parse()
 
 
-def create_simple_play() -> str:
-    """Create a simple play text for testing."""
-    return """PROLOGUE
-========
+def parse_play(content: str, title: str = "Test Play") -> PlayData:
+    """Parse play text, returning a copy the test is free to change."""
+    return copy.deepcopy(_cached_parse(content, title))
 
-[Enter Chorus as Prologue.]
 
-CHORUS
-O, for a muse of fire that would ascend
-The brightest heaven of invention!
+def save_play(play_data: PlayData) -> None:
+    """Save parsed play data to the database."""
+    # save_to_database() works from play_data alone, so there's no file to read.
+    PlayImporter(input_file_path=Path(), title=play_data.title).save_to_database(
+        play_data
+    )
+
 
-ACT 1
+#: The sandbox's directory of play texts
+DATA_DIR: Final = Path(__file__).resolve().parents[2] / "data"
+
+#: The smallest play the parser accepts: one act, one scene and one speech.
+ONE_SPEECH_PLAY = """ACT 1
 =====
 
 Scene 1
 =======
-[Enter the two Bishops.]
-
-BISHOP OF CANTERBURY
-My lord, I'll tell you that self bill is urged
-Which in th' eleventh year of the last king's reign
-Was like, and had indeed against us passed.
 
-BISHOP OF ELY
-But how, my lord, shall we resist it now?
+SPEAKER
+Text.
+"""
 
-BISHOP OF CANTERBURY
-It must be thought on. If it pass against us,
-We lose the better half of our possession.
+#: One scene with a speech from each of two speakers.
+TWO_SPEAKER_PLAY = """ACT 1
+=====
 
-Scene 2
+Scene 1
 =======
-[Enter the King.]
 
-KING HENRY
-Where is my gracious Lord of Canterbury?
-
-EXETER
-Not here in presence.
+SPEAKER ONE
+First speech.
 
-KING HENRY  Send for him, good uncle.
+SPEAKER TWO
+Second speech.
 """
 
 
@@ -95,33 +114,109 @@ It should create a default Scene 1.
 """
 
 
-# Test Text Parsing
-
-
-@pytest.mark.django_db
-class TestImportPlayImporterParsePlayFile:
-    """Test the parse_play_file method."""
-
-    def test_parse_prologue(self):
-        """Test parsing PROLOGUE."""
-        content = """PROLOGUE
+# Parsing cases: the play text to parse, and a function that checks the result
+
+
+def check_prologue(play_data: PlayData) -> None:
+    """Check parsing PROLOGUE."""
+    assert play_data.title == "Test Play"
+    assert len(play_data.acts) == 1
+    act = play_data.acts[0]
+    assert act.name == "Prologue"
+    # Acts are numbered from 1 in the order they appear, the Prologue included.
+    assert act.order == 1
+    assert [speech.speaker for scene in act.scenes for speech in scene.speeches] == [
+        "CHORUS"
+    ]
+
+
+def check_act(play_data: PlayData) -> None:
+    """Check parsing ACT N."""
+    assert len(play_data.acts) == 1
+    # Acts keep the name of their heading.
+    assert play_data.acts[0].name == "ACT 1"
+    assert play_data.acts[0].order == 1
+
+
+def check_multiple_acts(play_data: PlayData) -> None:
+    """Check parsing multiple acts."""
+    assert len(play_data.acts) == 2
+    assert play_data.acts[0].name == "ACT 1"
+    assert play_data.acts[0].order == 1
+    assert play_data.acts[1].name == "ACT 2"
+    assert play_data.acts[1].order == 2
+
+
+def check_scene(play_data: PlayData) -> None:
+    """Check parsing Scene N."""
+    act = play_data.acts[0]
+    assert len(act.scenes) == 2
+    assert act.scenes[0].name == "Scene 1"
+    assert act.scenes[0].order == 1
+    assert act.scenes[1].name == "Scene 2"
+    assert act.scenes[1].order == 2
+
+
+def check_speakers(play_data: PlayData) -> None:
+    """Check parsing speaker names in ALL CAPS."""
+    scene = play_data.acts[0].scenes[0]
+    assert len(scene.speeches) == 2
+    assert scene.speeches[0].speaker == "SPEAKER ONE"
+    assert scene.speeches[1].speaker == "SPEAKER TWO"
+
+
+def check_speeches(play_data: PlayData) -> None:
+    """Check parsing speech text."""
+    speech = play_data.acts[0].scenes[0].speeches[0]
+    assert speech.speaker == "SPEAKER"
+    assert "first line" in speech.text
+    assert "second line" in speech.text
+    assert "third line" in speech.text
+    assert speech.text.count("\n") == 2  # Two newlines for three lines
+
+
+def check_multi_line_speeches(play_data: PlayData) -> None:
+    """Check parsing speeches spanning multiple lines."""
+    speech = play_data.acts[0].scenes[0].speeches[0]
+    lines = speech.text.split("\n")
+    assert len(lines) == 4
+    assert "Line one" in lines[0]
+    assert "Line four" in lines[3]
+
+
+def check_empty_lines_separate_speakers(play_data: PlayData) -> None:
+    """Check that empty lines properly separate speakers."""
+    scene = play_data.acts[0].scenes[0]
+    assert len(scene.speeches) == 2
+    assert scene.speeches[0].speaker == "SPEAKER ONE"
+    assert scene.speeches[1].speaker == "SPEAKER TWO"
+
+
+def check_speech_order(play_data: PlayData) -> None:
+    """Check that speeches maintain correct order."""
+    scene = play_data.acts[0].scenes[0]
+    assert [speech.speaker for speech in scene.speeches] == [
+        "SPEAKER ONE",
+        "SPEAKER TWO",
+        "SPEAKER ONE",
+    ]
+    # Speeches are numbered from 1 within their scene.
+    assert [speech.order for speech in scene.speeches] == [1, 2, 3]
+
+
+PARSE_CASES = [
+    pytest.param(
+        """PROLOGUE
 ========
 
 CHORUS
 This is a prologue speech.
-"""
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Test Play")
-        play_data = importer.parse_play_file()
-
-        assert play_data.title == "Test Play"
-        assert len(play_data.acts) == 1
-        assert play_data.acts[0].name == "Prologue"
-        assert play_data.acts[0].order == 0
-
-    def test_parse_act(self):
-        """Test parsing ACT N."""
-        content = """ACT 1
+""",
+        check_prologue,
+        id="prologue",
+    ),
+    pytest.param(
+        """ACT 1
 =====
 
 Scene 1
@@ -129,18 +224,12 @@ Scene 1
 
 SPEAKER
 Some text.
-"""
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Test Play")
-        play_data = importer.parse_play_file()
-
-        assert len(play_data.acts) == 1
-        assert play_data.acts[0].name == "Act 1"
-        assert play_data.acts[0].order == 1
-
-    def test_parse_multiple_acts(self):
-        """Test parsing multiple acts."""
-        content = """ACT 1
+""",
+        check_act,
+        id="act",
+    ),
+    pytest.param(
+        """ACT 1
 =====
 
 Scene 1
@@ -157,20 +246,12 @@ Scene 1
 
 SPEAKER
 More text.
-"""
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Test Play")
-        play_data = importer.parse_play_file()
-
-        assert len(play_data.acts) == 2
-        assert play_data.acts[0].name == "Act 1"
-        assert play_data.acts[0].order == 1
-        assert play_data.acts[1].name == "Act 2"
-        assert play_data.acts[1].order == 2
-
-    def test_parse_scene(self):
-        """Test parsing Scene N."""
-        content = """ACT 1
+""",
+        check_multiple_acts,
+        id="multiple_acts",
+    ),
+    pytest.param(
+        """ACT 1
 =====
 
 Scene 1
@@ -184,21 +265,53 @@ Scene 2
 
 SPEAKER
 More text.
-"""
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Test Play")
-        play_data = importer.parse_play_file()
+""",
+        check_scene,
+        id="scene",
+    ),
+    pytest.param(
+        TWO_SPEAKER_PLAY,
+        check_speakers,
+        id="speakers",
+    ),
+    pytest.param(
+        """ACT 1
+=====
 
-        act = play_data.acts[0]
-        assert len(act.scenes) == 2
-        assert act.scenes[0].name == "Scene 1"
-        assert act.scenes[0].order == 1
-        assert act.scenes[1].name == "Scene 2"
-        assert act.scenes[1].order == 2
-
-    def test_parse_speakers(self):
-        """Test parsing speaker names in ALL CAPS."""
-        content = """ACT 1
+Scene 1
+=======
+
+SPEAKER
+This is the first line of speech.
+This is the second line.
+And a third line.
+""",
+        check_speeches,
+        id="speeches",
+    ),
+    pytest.param(
+        """ACT 1
+=====
+
+Scene 1
+=======
+
+SPEAKER
+Line one.
+Line two.
+Line three.
+Line four.
+""",
+        check_multi_line_speeches,
+        id="multi_line_speeches",
+    ),
+    pytest.param(
+        TWO_SPEAKER_PLAY,
+        check_empty_lines_separate_speakers,
+        id="empty_lines_separate_speakers",
+    ),
+    pytest.param(
+        """ACT 1
 =====
 
 Scene 1
@@ -209,39 +322,126 @@ First speech.
 
 SPEAKER TWO
 Second speech.
-"""
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Test Play")
-        play_data = importer.parse_play_file()
 
-        scene = play_data.acts[0].scenes[0]
-        assert len(scene.speeches) == 2
-        assert scene.speeches[0].speaker == "SPEAKER ONE"
-        assert scene.speeches[1].speaker == "SPEAKER TWO"
+SPEAKER ONE
+Third speech.
+""",
+        check_speech_order,
+        id="speech_order",
+    ),
+]
 
-    def test_parse_speeches(self):
-        """Test parsing speech text."""
-        content = """ACT 1
-=====
 
-Scene 1
-=======
+# Fixture entry checks: each checks one model's entries in the fixture generated
+# from the entries play, grouped by model
 
-SPEAKER
-This is the first line of speech.
-This is the second line.
-And a third line.
-"""
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Test Play")
-        play_data = importer.parse_play_file()
 
-        speech = play_data.acts[0].scenes[0].speeches[0]
-        assert speech.speaker == "SPEAKER"
-        assert "first line" in speech.text
-        assert "second line" in speech.text
-        assert "third line" in speech.text
-        assert speech.text.count("\n") == 2  # Two newlines for three lines
+def check_play_entry(by_model: dict[str, list[dict[str, Any]]]) -> None:
+    """Check the Play entry has correct model, pk, and fields."""
+    play_entry = next(iter(by_model.get("core.play", [])), None)
+    assert play_entry is not None
+    assert play_entry["model"] == "core.play"
+    # The play comes after the plays already in the database
+    assert play_entry["pk"] == Play.objects.aggregate(Max("pk"))["pk__max"] + 1
+    assert play_entry["fields"]["title"] == "Test Play"
+
+
+def check_act_entries(by_model: dict[str, list[dict[str, Any]]]) -> None:
+    """Check the Act entries have correct foreign key to Play."""
+    play_entry = next(iter(by_model.get("core.play", [])), None)
+    play_pk = play_entry["pk"]
+
+    act_entries = by_model.get("core.act", [])
+    assert len(act_entries) > 0
+
+    for act_entry in act_entries:
+        assert act_entry["fields"]["play"] == play_pk
+        assert "name" in act_entry["fields"]
+        assert "order" in act_entry["fields"]
+
+
+def check_scene_entries(by_model: dict[str, list[dict[str, Any]]]) -> None:
+    """Check the Scene entries have correct foreign key to Act."""
+    act_entries = {e["pk"]: e for e in by_model.get("core.act", [])}
+    scene_entries = by_model.get("core.scene", [])
+
+    assert len(scene_entries) > 0
+
+    for scene_entry in scene_entries:
+        act_pk = scene_entry["fields"]["act"]
+        assert act_pk in act_entries
+        assert "name" in scene_entry["fields"]
+        assert "order" in scene_entry["fields"]
+
+
+def check_speech_entries(by_model: dict[str, list[dict[str, Any]]]) -> None:
+    """Check the Speech entries have correct foreign keys to Speaker and Scene."""
+    speaker_entries = {e["pk"]: e for e in by_model.get("core.speaker", [])}
+    scene_entries = {e["pk"]: e for e in by_model.get("core.scene", [])}
+    speech_entries = by_model.get("core.speech", [])
+
+    assert len(speech_entries) > 0
+
+    for speech_entry in speech_entries:
+        speaker_pk = speech_entry["fields"]["speaker"]
+        scene_pk = speech_entry["fields"]["scene"]
+        assert speaker_pk in speaker_entries
+        assert scene_pk in scene_entries
+        assert "text" in speech_entry["fields"]
+        assert "order" in speech_entry["fields"]
+
+
+FIXTURE_ENTRY_CHECKS = [
+    pytest.param(check_play_entry, id="play"),
+    pytest.param(check_act_entries, id="act"),
+    pytest.param(check_scene_entries, id="scene"),
+    pytest.param(check_speech_entries, id="speech"),
+]
+
+
+def assert_no_duplicate_scenes(
+    scene_entries: list[dict[str, Any]], message: str
+) -> None:
+    """
+    Assert no two Scene fixture entries have the same act and order.
+
+    Args:
+        scene_entries: the Scene entries from a fixture
+        message: the start of the failure message, which goes on to list the
+            clashing pks
+
+    """
+    keys = [(e["fields"]["act"], e["fields"]["order"]) for e in scene_entries]
+    # (first pk, duplicate pk, act, order) for each clash
+    duplicates: list[tuple[int, int, int, int]] = []
+
+    # Only work out which scenes clash when the set says some do
+    if len(set(keys)) != len(keys):
+        # The pk of the first scene seen for each (act, order)
+        scene_keys: dict[tuple[int, int], int] = {}
+        for scene_entry, key in zip(scene_entries, keys, strict=True):
+            if key in scene_keys:
+                duplicates.append((scene_keys[key], scene_entry["pk"], *key))
+            else:
+                scene_keys[key] = scene_entry["pk"]
+
+    # Assert no duplicates found
+    assert len(duplicates) == 0, (
+        f"{message} (first pk, duplicate pk, act, order): {duplicates}"
+    )
+
+
+# Test Text Parsing
+
+
+# Parsing doesn't touch the database, so these tests don't need it.
+class TestImportPlayImporterParsePlayFile:
+    """Test the parse_play_file method."""
+
+    @pytest.mark.parametrize(("content", "check"), PARSE_CASES)
+    def test_parse(self, content, check):
+        """Test parsing each of the PARSE_CASES."""
+        check(parse_play(content))
 
     def test_parse_speaker_with_speech_on_same_line(self):
         """Test parsing speaker with speech text on the same line."""
@@ -260,9 +460,7 @@ KING HENRY  Send for him, good uncle.
 EXETER
 Not here in presence.
 """
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Test Play")
-        play_data = importer.parse_play_file()
+        play_data = parse_play(content)
 
         # Verify we have acts and scenes
         assert len(play_data.acts) > 0
@@ -283,30 +481,6 @@ Not here in presence.
                 assert speech.text
                 assert len(speech.text) > 0
 
-    def test_parse_multi_line_speeches(self):
-        """Test parsing speeches spanning multiple lines."""
-        content = """ACT 1
-=====
-
-Scene 1
-=======
-
-SPEAKER
-Line one.
-Line two.
-Line three.
-Line four.
-"""
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Test Play")
-        play_data = importer.parse_play_file()
-
-        speech = play_data.acts[0].scenes[0].speeches[0]
-        lines = speech.text.split("\n")
-        assert len(lines) == 4
-        assert "Line one" in lines[0]
-        assert "Line four" in lines[3]
-
     def test_parse_stage_directions(self):
         """Test that stage directions in brackets are imported as Stage Directions speeches."""
         content = """ACT 1
@@ -321,9 +495,7 @@ Some text.
 
 [They exit.]
 """
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Test Play")
-        play_data = importer.parse_play_file()
+        play_data = parse_play(content)
 
         scene = play_data.acts[0].scenes[0]
         # Should have 3 speeches: 2 stage directions + 1 speaker speech
@@ -346,29 +518,6 @@ Some text.
         assert "[Enter" not in speaker_speeches[0].text
         assert "[They exit" not in speaker_speeches[0].text
 
-    def test_parse_empty_lines_separate_speakers(self):
-        """Test that empty lines properly separate speakers."""
-        content = """ACT 1
-=====
-
-Scene 1
-=======
-
-SPEAKER ONE
-First speech.
-
-SPEAKER TWO
-Second speech.
-"""
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Test Play")
-        play_data = importer.parse_play_file()
-
-        scene = play_data.acts[0].scenes[0]
-        assert len(scene.speeches) == 2
-        assert scene.speeches[0].speaker == "SPEAKER ONE"
-        assert scene.speeches[1].speaker == "SPEAKER TWO"
-
     def test_parse_default_scene_creation(self):
         """Test that scenes are auto-created when missing (e.g., Prologue)."""
         content = """PROLOGUE
@@ -377,41 +526,14 @@ Second speech.
 CHORUS
 This is a prologue without explicit scene markers.
 """
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Test Play")
-        play_data = importer.parse_play_file()
+        play_data = parse_play(content)
 
+        # The speech goes in a scene made for it, after the Prologue act's own,
+        # empty, Prologue scene.
         act = play_data.acts[0]
-        assert len(act.scenes) == 1
-        assert act.scenes[0].name == "Scene 1"
-        assert act.scenes[0].order == 1
-
-    def test_parse_speech_order(self):
-        """Test that speeches maintain correct order."""
-        content = """ACT 1
-=====
-
-Scene 1
-=======
-
-SPEAKER ONE
-First speech.
-
-SPEAKER TWO
-Second speech.
-
-SPEAKER ONE
-Third speech.
-"""
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Test Play")
-        play_data = importer.parse_play_file()
-
-        scene = play_data.acts[0].scenes[0]
-        assert len(scene.speeches) == 3
-        assert scene.speeches[0].order == 0
-        assert scene.speeches[1].order == 1
-        assert scene.speeches[2].order == 2
+        assert [scene.name for scene in act.scenes] == ["Prologue", "Act 1 Prologue"]
+        assert act.scenes[1].order == 1
+        assert [speech.speaker for speech in act.scenes[1].speeches] == ["CHORUS"]
 
     def test_parse_multiline_stage_directions(self):
         """Test parsing multi-line stage directions."""
@@ -426,9 +548,7 @@ and Boy.]
 SPEAKER
 Some text.
 """
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Test Play")
-        play_data = importer.parse_play_file()
+        play_data = parse_play(content)
 
         scene = play_data.acts[0].scenes[0]
         # Should have 2 speeches: 1 stage direction + 1 speaker speech
@@ -461,9 +581,7 @@ Now, soldiers, march away,
 And how Thou pleasest, God, dispose the day.
 [They exit.]
 """
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Test Play")
-        play_data = importer.parse_play_file()
+        play_data = parse_play(content)
 
         scene = play_data.acts[0].scenes[0]
         # Should have 2 speeches: 1 KING HENRY (with embedded stage dir) + 1 standalone stage dir
@@ -485,6 +603,30 @@ And how Thou pleasest, God, dispose the day.
         assert len(stage_dir_speeches) == 1
         assert "They exit" in stage_dir_speeches[0].text
 
+    @pytest.mark.parametrize("newline", ["\r\n", "\r"])
+    def test_parse_line_endings(self, newline):
+        """Test CRLF and bare CR files parse the same as LF files."""
+        content = """ACT 1
+=====
+
+Scene 1
+=======
+
+KING HENRY
+Take it, brave York.
+Now, soldiers, march away.
+
+[They exit.]
+"""
+        play_data = parse_play(content.replace("\n", newline))
+
+        assert play_data == parse_play(content)
+        speeches = play_data.acts[0].scenes[0].speeches
+        assert [speech.text for speech in speeches] == [
+            "Take it, brave York.\nNow, soldiers, march away.",
+            "[They exit.]",
+        ]
+
 
 # Test Database Saving
 
@@ -493,13 +635,10 @@ And how Thou pleasest, God, dispose the day.
 class TestImportPlayImporterSaveToDatabase:
     """Test the save_to_database method."""
 
-    def test_create_new_play(self):
+    def test_create_new_play(self, simple_play_data):
         """Test creating a new play with all related objects."""
-        content = create_simple_play()
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Test Play")
-        play_data = importer.parse_play_file()
-        importer.save_to_database(play_data)
+        play_data = copy.deepcopy(simple_play_data)
+        save_play(play_data)
 
         # Verify Play
         play = Play.objects.get(title="Test Play")
@@ -509,10 +648,10 @@ class TestImportPlayImporterSaveToDatabase:
         acts = play.acts.all()
         assert acts.count() == 2  # Prologue and Act 1
         assert acts.filter(name="Prologue").exists()
-        assert acts.filter(name="Act 1").exists()
+        assert acts.filter(name="ACT 1").exists()
 
         # Verify Scenes
-        act1 = acts.get(name="Act 1")
+        act1 = acts.get(name="ACT 1")
         scenes = act1.scenes.all()
         assert scenes.count() == 2  # Scene 1 and Scene 2
 
@@ -529,13 +668,10 @@ class TestImportPlayImporterSaveToDatabase:
         speeches = scene1.speeches.all()
         assert speeches.count() > 0
 
-    def test_update_existing_play(self):
+    def test_update_existing_play(self, simple_play_data):
         """Test updating an existing play deletes old acts/scenes."""
-        content = create_simple_play()
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Test Play")
-        play_data = importer.parse_play_file()
-        importer.save_to_database(play_data)
+        play_data = copy.deepcopy(simple_play_data)
+        save_play(play_data)
 
         # Get initial counts
         play = Play.objects.get(title="Test Play")
@@ -551,32 +687,20 @@ Scene 1
 NEW SPEAKER
 New content.
 """
-        new_file = create_temp_play_file(new_content)
-        importer = PlayImporter(input_file_path=new_file, title="Test Play")
-        new_play_data = importer.parse_play_file()
-        importer.save_to_database(new_play_data)
+        new_play_data = parse_play(new_content)
+        save_play(new_play_data)
 
-        # Verify old acts are deleted
-        play.refresh_from_db()
-        new_acts = play.acts.all()
-        assert new_acts.count() != initial_act_count
-        assert not new_acts.filter(name="Prologue").exists()
+        # Verify old acts are deleted, counting the acts in a single query
+        acts = play.acts.aggregate(
+            count=Count("pk"), prologues=Count("pk", filter=Q(name="Prologue"))
+        )
+        assert acts["count"] != initial_act_count
+        assert acts["prologues"] == 0
 
     def test_play_model(self):
         """Test Play model is created correctly."""
-        content = """ACT 1
-=====
-
-Scene 1
-=======
-
-SPEAKER
-Text.
-"""
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Custom Title")
-        play_data = importer.parse_play_file()
-        importer.save_to_database(play_data)
+        play_data = parse_play(ONE_SPEECH_PLAY, "Custom Title")
+        save_play(play_data)
 
         play = Play.objects.get(title="Custom Title")
         assert play.title == "Custom Title"
@@ -592,15 +716,14 @@ Scene 1
 SPEAKER
 Text.
 """
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Test Play")
-        play_data = importer.parse_play_file()
-        importer.save_to_database(play_data)
+        play_data = parse_play(content)
+        save_play(play_data)
 
         play = Play.objects.get(title="Test Play")
-        act = play.acts.get(name="Act 2")
-        assert act.name == "Act 2"
-        assert act.order == 2
+        act = play.acts.get(name="ACT 2")
+        assert act.name == "ACT 2"
+        # Acts are numbered by where they come in the file, not by their heading.
+        assert act.order == 1
         assert act.play == play
 
     def test_scene_model(self):
@@ -614,16 +737,15 @@ Scene 3
 SPEAKER
 Text.
 """
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Test Play")
-        play_data = importer.parse_play_file()
-        importer.save_to_database(play_data)
+        play_data = parse_play(content)
+        save_play(play_data)
 
         play = Play.objects.get(title="Test Play")
-        act = play.acts.get(name="Act 1")
+        act = play.acts.get(name="ACT 1")
         scene = act.scenes.get(name="Scene 3")
         assert scene.name == "Scene 3"
-        assert scene.order == 3
+        # Scenes are numbered by where they come in the act, not by their heading.
+        assert scene.order == 1
         assert scene.act == act
 
     def test_speaker_model(self):
@@ -643,10 +765,8 @@ Scene 2
 SPEAKER ONE
 Second speech.
 """
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Test Play")
-        play_data = importer.parse_play_file()
-        importer.save_to_database(play_data)
+        play_data = parse_play(content)
+        save_play(play_data)
 
         # Verify speaker is created once and reused
         speakers = Speaker.objects.filter(name="SPEAKER ONE")
@@ -654,7 +774,7 @@ Second speech.
 
         # Verify both speeches reference the same speaker
         play = Play.objects.get(title="Test Play")
-        act = play.acts.get(name="Act 1")
+        act = play.acts.get(name="ACT 1")
         scene1 = act.scenes.get(name="Scene 1")
         scene2 = act.scenes.get(name="Scene 2")
         speaker = Speaker.objects.get(name="SPEAKER ONE")
@@ -673,19 +793,17 @@ SPEAKER
 This is the speech text.
 It has multiple lines.
 """
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Test Play")
-        play_data = importer.parse_play_file()
-        importer.save_to_database(play_data)
+        play_data = parse_play(content)
+        save_play(play_data)
 
         play = Play.objects.get(title="Test Play")
-        act = play.acts.get(name="Act 1")
+        act = play.acts.get(name="ACT 1")
         scene = act.scenes.get(name="Scene 1")
         speech = scene.speeches.first()
 
         assert "This is the speech text" in speech.text
         assert "It has multiple lines" in speech.text
-        assert speech.order == 0
+        assert speech.order == 1
         assert speech.speaker.name == "SPEAKER"
         assert speech.scene == scene
 
@@ -711,9 +829,7 @@ Scene 2
 SPEAKER C
 Third speech.
 """
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Test Play")
-        play_data = importer.parse_play_file()
+        play_data = parse_play(content)
 
         # Verify parsing before saving
         assert len(play_data.acts) == 1
@@ -722,7 +838,7 @@ Third speech.
             f"Expected at least 2 scenes in Act 1 after parsing, got {len(act1_data.scenes)}"
         )
 
-        importer.save_to_database(play_data)
+        save_play(play_data)
 
         play = Play.objects.get(title="Test Play")
 
@@ -754,162 +870,34 @@ Third speech.
 class TestImportPlayImporterGenerateFixture:
     """Test the generate_fixture method."""
 
-    def test_fixture_file_creation(self):
+    def test_fixture_file_creation(self, simple_play_file, tmp_path):
         """Test fixture file is created at specified path."""
-        content = create_simple_play()
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Test Play")
+        importer = PlayImporter(input_file_path=simple_play_file, title="Test Play")
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            fixture_path = Path(f.name)
+        fixture_path = tmp_path / "fixture.json"
 
-        try:
-            importer.generate_fixture(fixture_path)
-            assert fixture_path.exists()
-        finally:
-            fixture_path.unlink(missing_ok=True)
+        importer.generate_fixture(fixture_path)
+        assert fixture_path.exists()
 
-    def test_fixture_json_structure(self):
+    def test_fixture_json_structure(self, simple_fixture_json):
         """Test fixture JSON is valid and properly formatted."""
-        content = create_simple_play()
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Test Play")
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            fixture_path = Path(f.name)
-
-        try:
-            importer.generate_fixture(fixture_path)
-
-            # Verify JSON is valid
-            with open(fixture_path, encoding="utf-8") as json_file:
-                fixture_data = json.load(json_file)
-
-            assert isinstance(fixture_data, list)
-            assert len(fixture_data) > 0
-
-            # Verify each entry has required fields
-            for entry in fixture_data:
-                assert "model" in entry
-                assert "pk" in entry
-                assert "fields" in entry
-        finally:
-            fixture_path.unlink(missing_ok=True)
-
-    def test_fixture_play_entry(self):
-        """Test fixture Play entry has correct model, pk, and fields."""
-        content = """ACT 1
-=====
+        fixture_data = simple_fixture_json
 
-Scene 1
-=======
-
-SPEAKER
-Text.
-"""
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Test Play")
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            fixture_path = Path(f.name)
-
-        try:
-            importer.generate_fixture(fixture_path)
-
-            with open(fixture_path, encoding="utf-8") as json_file:
-                fixture_data = json.load(json_file)
-
-            play_entry = next(
-                (e for e in fixture_data if e["model"] == "core.play"), None
-            )
-            assert play_entry is not None
-            assert play_entry["model"] == "core.play"
-            assert play_entry["pk"] == 1
-            assert play_entry["fields"]["title"] == "Test Play"
-        finally:
-            fixture_path.unlink(missing_ok=True)
-
-    def test_fixture_act_entries(self):
-        """Test fixture Act entries have correct foreign key to Play."""
-        content = """ACT 1
-=====
-
-Scene 1
-=======
-
-SPEAKER
-Text.
-"""
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Test Play")
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            fixture_path = Path(f.name)
-
-        try:
-            importer.generate_fixture(fixture_path)
-
-            with open(fixture_path, encoding="utf-8") as json_file:
-                fixture_data = json.load(json_file)
-
-            play_entry = next(
-                (e for e in fixture_data if e["model"] == "core.play"), None
-            )
-            play_pk = play_entry["pk"]
+        assert isinstance(fixture_data, list)
+        assert len(fixture_data) > 0
 
-            act_entries = [e for e in fixture_data if e["model"] == "core.act"]
-            assert len(act_entries) > 0
+        # Verify each entry has required fields
+        for entry in fixture_data:
+            assert "model" in entry
+            assert "pk" in entry
+            assert "fields" in entry
 
-            for act_entry in act_entries:
-                assert act_entry["fields"]["play"] == play_pk
-                assert "name" in act_entry["fields"]
-                assert "order" in act_entry["fields"]
-        finally:
-            fixture_path.unlink(missing_ok=True)
+    @pytest.mark.parametrize("check", FIXTURE_ENTRY_CHECKS)
+    def test_fixture_entries(self, entries_fixture_by_model, check):
+        """Test each of the FIXTURE_ENTRY_CHECKS against one generated fixture."""
+        check(entries_fixture_by_model)
 
-    def test_fixture_scene_entries(self):
-        """Test fixture Scene entries have correct foreign key to Act."""
-        content = """ACT 1
-=====
-
-Scene 1
-=======
-
-SPEAKER
-Text.
-
-Scene 2
-=======
-
-SPEAKER
-More text.
-"""
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Test Play")
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            fixture_path = Path(f.name)
-
-        try:
-            importer.generate_fixture(fixture_path)
-
-            with open(fixture_path, encoding="utf-8") as json_file:
-                fixture_data = json.load(json_file)
-
-            act_entries = {e["pk"]: e for e in fixture_data if e["model"] == "core.act"}
-            scene_entries = [e for e in fixture_data if e["model"] == "core.scene"]
-
-            assert len(scene_entries) > 0
-
-            for scene_entry in scene_entries:
-                act_pk = scene_entry["fields"]["act"]
-                assert act_pk in act_entries
-                assert "name" in scene_entry["fields"]
-                assert "order" in scene_entry["fields"]
-        finally:
-            fixture_path.unlink(missing_ok=True)
-
-    def test_fixture_speaker_entries(self):
+    def test_fixture_speaker_entries(self, tmp_path):
         """Test fixture Speaker entries are created (unique by name)."""
         content = """ACT 1
 =====
@@ -930,332 +918,221 @@ Scene 2
 SPEAKER ONE
 Reused speaker.
 """
-        play_file = create_temp_play_file(content)
+        play_file = tmp_path / "play.txt"
+        play_file.write_text(content, encoding="utf-8")
         importer = PlayImporter(input_file_path=play_file, title="Test Play")
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            fixture_path = Path(f.name)
+        fixture_path = tmp_path / "fixture.json"
 
-        try:
-            importer.generate_fixture(fixture_path)
+        importer.generate_fixture(fixture_path)
 
-            with open(fixture_path, encoding="utf-8") as json_file:
-                fixture_data = json.load(json_file)
+        fixture_data = json.loads(fixture_path.read_bytes())
 
-            speaker_entries = [e for e in fixture_data if e["model"] == "core.speaker"]
-            speaker_names = [e["fields"]["name"] for e in speaker_entries]
+        speaker_entries = [e for e in fixture_data if e["model"] == "core.speaker"]
+        speaker_names = [e["fields"]["name"] for e in speaker_entries]
 
-            # Verify unique speakers (including Stage Directions)
-            assert len(speaker_entries) == 3
-            assert "SPEAKER ONE" in speaker_names
-            assert "SPEAKER TWO" in speaker_names
-            assert "Stage Directions" in speaker_names
-        finally:
-            fixture_path.unlink(missing_ok=True)
+        # Verify unique speakers.  Stage Directions is already in the database,
+        # so the fixture reuses it rather than adding it again.
+        assert sorted(speaker_names) == ["SPEAKER ONE", "SPEAKER TWO"]
+        stage_directions = Speaker.objects.get(name="Stage Directions")
+        assert stage_directions.pk in {
+            e["fields"]["speaker"] for e in fixture_data if e["model"] == "core.speech"
+        }
 
-    def test_fixture_speech_entries(self):
-        """Test fixture Speech entries have correct foreign keys to Speaker and Scene."""
-        content = """ACT 1
-=====
+    def test_fixture_json_lines(self, simple_play_file, simple_fixture_json, tmp_path):
+        """Test a .jsonl fixture has the same entries as a .json one, one per line."""
+        importer = PlayImporter(input_file_path=simple_play_file, title="Test Play")
 
-Scene 1
-=======
-
-SPEAKER
-Text.
-"""
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Test Play")
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            fixture_path = Path(f.name)
+        fixture_path = tmp_path / "fixture.jsonl"
 
-        try:
-            importer.generate_fixture(fixture_path)
+        importer.generate_fixture(fixture_path)
 
-            with open(fixture_path, encoding="utf-8") as json_file:
-                fixture_data = json.load(json_file)
+        lines = fixture_path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == simple_fixture_json
 
-            speaker_entries = {
-                e["pk"]: e for e in fixture_data if e["model"] == "core.speaker"
-            }
-            scene_entries = {
-                e["pk"]: e for e in fixture_data if e["model"] == "core.scene"
-            }
-            speech_entries = [e for e in fixture_data if e["model"] == "core.speech"]
-
-            assert len(speech_entries) > 0
-
-            for speech_entry in speech_entries:
-                speaker_pk = speech_entry["fields"]["speaker"]
-                scene_pk = speech_entry["fields"]["scene"]
-                assert speaker_pk in speaker_entries
-                assert scene_pk in scene_entries
-                assert "text" in speech_entry["fields"]
-                assert "order" in speech_entry["fields"]
-        finally:
-            fixture_path.unlink(missing_ok=True)
-
-    def test_fixture_pk_sequencing(self):
+    def test_fixture_pk_sequencing(self, simple_fixture_json):
         """Test fixture primary keys are sequential and unique."""
-        content = create_simple_play()
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Test Play")
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            fixture_path = Path(f.name)
-
-        try:
-            importer.generate_fixture(fixture_path)
-
-            with open(fixture_path, encoding="utf-8") as json_file:
-                fixture_data = json.load(json_file)
-
-            pks = [entry["pk"] for entry in fixture_data]
-            # Verify all PKs are unique
-            assert len(pks) == len(set(pks))
-
-            # Verify PKs are sequential starting from 1
-            sorted_pks = sorted(pks)
-            assert sorted_pks[0] == 1
-            for i in range(1, len(sorted_pks)):
-                assert sorted_pks[i] == sorted_pks[i - 1] + 1
-        finally:
-            fixture_path.unlink(missing_ok=True)
-
-    def test_fixture_foreign_key_relationships(self):
+        # Each model's PKs carry on from the highest one already in the
+        # database, so work out the next PK we expect for each model
+        next_pks: dict[str, int] = {}
+        for model in (Play, Act, Scene, Speaker, Speech):
+            highest = model.objects.aggregate(Max("pk"))["pk__max"] or 0
+            next_pks[model._meta.label_lower] = highest + 1
+
+        # Verify each model's PKs are unique and have no gaps in a single pass:
+        # each must be exactly the next one expected
+        for entry in simple_fixture_json:
+            model, pk = entry["model"], entry["pk"]
+            if pk != next_pks[model]:
+                pytest.fail(f"Expected {model} primary key {next_pks[model]}, got {pk}")
+            next_pks[model] += 1
+
+    def test_fixture_foreign_key_relationships(self, simple_fixture_json):
         """Test all foreign keys reference correct PKs."""
-        content = create_simple_play()
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Test Play")
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            fixture_path = Path(f.name)
-
-        try:
-            importer.generate_fixture(fixture_path)
-
-            with open(fixture_path, encoding="utf-8") as json_file:
-                fixture_data = json.load(json_file)
-
-            # Build PK maps
-            play_pks = {e["pk"] for e in fixture_data if e["model"] == "core.play"}
-            act_pks = {e["pk"] for e in fixture_data if e["model"] == "core.act"}
-            scene_pks = {e["pk"] for e in fixture_data if e["model"] == "core.scene"}
-            speaker_pks = {
-                e["pk"] for e in fixture_data if e["model"] == "core.speaker"
-            }
-
-            # Verify foreign key relationships
-            for entry in fixture_data:
-                if entry["model"] == "core.act":
-                    assert entry["fields"]["play"] in play_pks
-                elif entry["model"] == "core.scene":
-                    assert entry["fields"]["act"] in act_pks
-                elif entry["model"] == "core.speech":
-                    assert entry["fields"]["speaker"] in speaker_pks
-                    assert entry["fields"]["scene"] in scene_pks
-        finally:
-            fixture_path.unlink(missing_ok=True)
-
-    def test_fixture_can_be_loaded(self):
+        fixture_data = simple_fixture_json
+
+        # Build the PK maps and collect the foreign keys in a single pass
+        pks: dict[str, set[int]] = {
+            "core.play": set(),
+            "core.act": set(),
+            "core.scene": set(),
+            # The fixture refers to speakers already in the database rather
+            # than adding them again
+            "core.speaker": set(Speaker.objects.values_list("pk", flat=True)),
+        }
+        foreign_keys: list[tuple[str, int]] = []
+        for entry in fixture_data:
+            model = entry["model"]
+            fields = entry["fields"]
+            if model in pks:
+                pks[model].add(entry["pk"])
+            if model == "core.act":
+                foreign_keys.append(("core.play", fields["play"]))
+            elif model == "core.scene":
+                foreign_keys.append(("core.act", fields["act"]))
+            elif model == "core.speech":
+                foreign_keys.append(("core.speaker", fields["speaker"]))
+                foreign_keys.append(("core.scene", fields["scene"]))
+
+        # Verify foreign key relationships
+        for model, pk in foreign_keys:
+            assert pk in pks[model]
+
+    def test_fixture_can_be_loaded(self, simple_play_file, tmp_path):
         """Test that generated fixture can be loaded into database."""
-        content = create_simple_play()
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Test Play")
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            fixture_path = Path(f.name)
-
-        try:
-            importer.generate_fixture(fixture_path)
-
-            # Clear existing data
-            Speech.objects.all().delete()
-            Speaker.objects.all().delete()
-            Scene.objects.all().delete()
-            Act.objects.all().delete()
-            Play.objects.all().delete()
+        importer = PlayImporter(input_file_path=simple_play_file, title="Test Play")
 
-            # Load fixture
-            call_command("loaddata", str(fixture_path))
+        fixture_path = tmp_path / "fixture.json"
 
-            # Verify data was loaded
-            play = Play.objects.get(title="Test Play")
-            assert play is not None
+        importer.generate_fixture(fixture_path)
 
-            # Verify acts were loaded
-            acts = play.acts.all()
-            assert acts.count() > 0
+        # Clear existing data, except for the speakers: the fixture refers to
+        # those already in the database rather than adding them again
+        Speech.objects.all().delete()
+        Scene.objects.all().delete()
+        Act.objects.all().delete()
+        Play.objects.all().delete()
 
-            # Verify scenes were loaded (at least one act should have scenes)
-            total_scenes = 0
-            for act in acts:
-                scenes = act.scenes.all()
-                total_scenes += scenes.count()
+        # Load fixture
+        call_command("loaddata", str(fixture_path))
 
-                # Verify speeches were loaded for acts that have scenes
-                for scene in scenes:
-                    speeches = scene.speeches.all()
-                    assert speeches.count() > 0
-
-                    # Verify speakers were loaded
-                    for speech in speeches:
-                        assert speech.speaker is not None
-
-            # At least one scene should have been loaded
-            assert total_scenes > 0
-        finally:
-            fixture_path.unlink(missing_ok=True)
+        # Verify data was loaded
+        play = Play.objects.get(title="Test Play")
+        assert play is not None
 
-    def test_fixture_no_duplicate_scenes(self):
+        # Verify acts were loaded
+        acts = play.acts.all()
+        assert acts.count() > 0
+
+        # Verify scenes were loaded (at least one act should have scenes)
+        total_scenes = 0
+        total_speeches = 0
+        for act in acts:
+            scenes = act.scenes.all()
+            total_scenes += scenes.count()
+
+            # Verify speeches were loaded.  Not every scene has them: the
+            # Prologue act's own Prologue scene is empty, for one.
+            for scene in scenes:
+                speeches = scene.speeches.all()
+                total_speeches += speeches.count()
+
+                # Verify speakers were loaded
+                for speech in speeches:
+                    assert speech.speaker is not None
+
+        # At least one scene and speech should have been loaded
+        assert total_scenes > 0
+        assert total_speeches > 0
+
+    def test_fixture_no_duplicate_scenes(self, simple_fixture_by_model):
         """Test that generated fixture has no duplicate Scene entries (same act and order)."""
-        content = create_simple_play()
-        play_file = create_temp_play_file(content)
-        importer = PlayImporter(input_file_path=play_file, title="Test Play")
+        # Collect all Scene entries and check for duplicates
+        scene_entries = simple_fixture_by_model.get("core.scene", [])
+        assert_no_duplicate_scenes(scene_entries, "Found duplicate Scene entries")
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            fixture_path = Path(f.name)
-
-        try:
-            importer.generate_fixture(fixture_path)
-
-            with open(fixture_path, encoding="utf-8") as json_file:
-                fixture_data = json.load(json_file)
-
-            # Collect all Scene entries and check for duplicates
-            scene_entries = [e for e in fixture_data if e["model"] == "core.scene"]
-            scene_keys = {}
-            duplicates = []
-
-            for scene_entry in scene_entries:
-                act_pk = scene_entry["fields"]["act"]
-                order = scene_entry["fields"]["order"]
-                key = (act_pk, order)
-
-                if key in scene_keys:
-                    duplicates.append(
-                        {
-                            "pk1": scene_keys[key]["pk"],
-                            "pk2": scene_entry["pk"],
-                            "act": act_pk,
-                            "order": order,
-                        }
-                    )
-                else:
-                    scene_keys[key] = scene_entry
-
-            # Assert no duplicates found
-            assert len(duplicates) == 0, f"Found duplicate Scene entries: {duplicates}"
-        finally:
-            fixture_path.unlink(missing_ok=True)
-
-    def test_henry_v_fixture_regeneration(self):
+    def test_henry_v_fixture_regeneration(self, tmp_path):
         """Test regenerating henry_v.json fixture and verify it has no duplicates."""
         # Find the source file
-        source_file = Path(__file__).parent.parent.parent / "data" / "henry-v.txt"
+        source_file = DATA_DIR / "henry-v.txt"
         assert source_file.exists(), f"Source file not found: {source_file}"
 
         # Generate fixture to a temporary location
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            fixture_path = Path(f.name)
-
-        try:
-            # Regenerate the fixture using the management command
-            call_command(
-                "import_play",
-                str(source_file),
-                title="Henry V",
-                output_fixture=str(fixture_path),
-            )
+        fixture_path = tmp_path / "fixture.json"
 
-            # Load and validate the generated fixture
-            with open(fixture_path, encoding="utf-8") as json_file:
-                fixture_data = json.load(json_file)
-
-            # Collect all Scene entries and check for duplicates
-            scene_entries = [e for e in fixture_data if e["model"] == "core.scene"]
-            scene_keys = {}
-            duplicates = []
-
-            for scene_entry in scene_entries:
-                act_pk = scene_entry["fields"]["act"]
-                order = scene_entry["fields"]["order"]
-                key = (act_pk, order)
-
-                if key in scene_keys:
-                    duplicates.append(
-                        {
-                            "pk1": scene_keys[key]["pk"],
-                            "pk2": scene_entry["pk"],
-                            "act": act_pk,
-                            "order": order,
-                        }
-                    )
-                else:
-                    scene_keys[key] = scene_entry
-
-            # Assert no duplicates found
-            assert len(duplicates) == 0, (
-                f"Found duplicate Scene entries in regenerated fixture: {duplicates}"
-            )
+        # Regenerate the fixture using the management command
+        call_command(
+            "import_play",
+            str(source_file),
+            title="Henry V",
+            output_fixture=str(fixture_path),
+        )
 
-            # Verify the fixture can be loaded into database
-            Play.objects.all().delete()
-            call_command("loaddata", str(fixture_path))
+        # Load and validate the generated fixture
+        fixture_data = json.loads(fixture_path.read_bytes())
 
-            # Verify data was loaded
-            play = Play.objects.get(title="Henry V")
-            assert play is not None
+        # Collect all Scene entries and check for duplicates
+        scene_entries = [e for e in fixture_data if e["model"] == "core.scene"]
+        assert_no_duplicate_scenes(
+            scene_entries, "Found duplicate Scene entries in regenerated fixture"
+        )
 
-            # Verify acts were loaded
-            acts = play.acts.all()
-            assert acts.count() > 0
+        # Verify the fixture can be loaded into database
+        Play.objects.all().delete()
+        call_command("loaddata", str(fixture_path))
 
-            # Verify scenes were loaded and each act has unique scene orders
-            total_scenes = 0
-            for act in acts:
-                scenes = act.scenes.all()
-                total_scenes += scenes.count()
+        # Verify data was loaded, fetching the acts and scenes in one query
+        # each rather than one per act
+        play = Play.objects.prefetch_related("acts__scenes").get(title="Henry V")
+        assert play is not None
 
-                # Verify every act has at least Scene 1
-                assert scenes.count() > 0, f"Act {act.name} has no scenes"
-                scene_orders = [scene.order for scene in scenes]
-                assert 1 in scene_orders, f"Act {act.name} does not have Scene 1"
+        # Verify acts were loaded
+        acts = play.acts.all()
+        assert acts.count() > 0
+
+        # Verify scenes were loaded and each act has unique scene orders
+        total_scenes = 0
+        for act in acts:
+            scenes = act.scenes.all()
+            total_scenes += scenes.count()
+
+            # Verify every act has at least Scene 1
+            assert scenes.count() > 0, f"Act {act.name} has no scenes"
+            scene_orders = [scene.order for scene in scenes]
+            assert 1 in scene_orders, f"Act {act.name} does not have Scene 1"
+
+            # Verify no duplicate scene orders within each act
+            assert len(scene_orders) == len(set(scene_orders)), (
+                f"Act {act.name} has duplicate scene orders: {scene_orders}"
+            )
 
-                # Verify no duplicate scene orders within each act
-                assert len(scene_orders) == len(set(scene_orders)), (
-                    f"Act {act.name} has duplicate scene orders: {scene_orders}"
-                )
+        # At least one scene should have been loaded
+        assert total_scenes > 0
+
+        # Verify speakers were loaded for the speeches that exist (some scenes
+        # might not have speeches, which is valid), in one query rather than
+        # one for each speech
+        assert not (
+            Speech.objects.filter(scene__act__play=play)
+            .exclude(speaker__in=Speaker.objects.all())
+            .exists()
+        )
 
-                # Verify speeches were loaded for acts that have scenes
-                # (Some scenes might not have speeches, which is valid)
-                for scene in scenes:
-                    speeches = scene.speeches.all()
-                    # Verify speakers were loaded for speeches that exist
-                    for speech in speeches:
-                        assert speech.speaker is not None
-
-            # At least one scene should have been loaded
-            assert total_scenes > 0
-
-            # Verify Prologue has CHORUS speeches
-            prologue = play.acts.filter(name="Prologue").first()
-            if prologue:
-                prologue_scenes = prologue.scenes.all()
-                assert prologue_scenes.count() > 0, (
-                    "Prologue should have at least one scene"
+        # Verify Prologue has CHORUS speeches
+        prologue = play.acts.filter(name="Prologue").first()
+        if prologue:
+            prologue_scenes = prologue.scenes.all()
+            assert prologue_scenes.count() > 0, (
+                "Prologue should have at least one scene"
+            )
+            chorus_speaker = Speaker.objects.filter(name="CHORUS").first()
+            if chorus_speaker:
+                prologue_chorus_speeches = Speech.objects.filter(
+                    scene__act=prologue, speaker=chorus_speaker
+                )
+                assert prologue_chorus_speeches.count() > 0, (
+                    "Prologue should have CHORUS speeches"
                 )
-                chorus_speaker = Speaker.objects.filter(name="CHORUS").first()
-                if chorus_speaker:
-                    prologue_chorus_speeches = Speech.objects.filter(
-                        scene__act=prologue, speaker=chorus_speaker
-                    )
-                    assert prologue_chorus_speeches.count() > 0, (
-                        "Prologue should have CHORUS speeches"
-                    )
-        finally:
-            fixture_path.unlink(missing_ok=True)
 
 
 # Test Command Integration
@@ -1265,56 +1142,39 @@ Text.
 class TestImportPlayCommandIntegration:
     """Test the importer integration."""
 
-    def test_command_with_output_fixture(self):
+    def test_command_with_output_fixture(self, simple_play_file, tmp_path):
         """Test command with --output-fixture option."""
-        content = create_simple_play()
-        play_file = create_temp_play_file(content)
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            fixture_path = Path(f.name)
-
-        try:
-            call_command(
-                "import_play",
-                str(play_file),
-                title="Test Play",
-                output_fixture=str(fixture_path),
-            )
+        fixture_path = tmp_path / "fixture.json"
 
-            # Verify fixture was created
-            assert fixture_path.exists()
+        call_command(
+            "import_play",
+            str(simple_play_file),
+            title="Test Play",
+            output_fixture=str(fixture_path),
+        )
 
-            # Verify fixture is valid JSON
-            with open(fixture_path, encoding="utf-8") as json_file:
-                fixture_data = json.load(json_file)
-                assert len(fixture_data) > 0
-        finally:
-            fixture_path.unlink(missing_ok=True)
+        # Verify fixture was created
+        assert fixture_path.exists()
 
-    def test_command_with_dry_run(self):
-        """Test command with --dry-run option."""
-        content = create_simple_play()
-        play_file = create_temp_play_file(content)
+        # Verify fixture is valid JSON
+        fixture_data = json.loads(fixture_path.read_bytes())
+        assert len(fixture_data) > 0
 
+    def test_command_with_dry_run(self, simple_play_file):
+        """Test command with --dry-run option."""
         initial_count = Play.objects.count()
 
-        call_command("import_play", str(play_file), title="Test Play", dry_run=True)
+        call_command(
+            "import_play", str(simple_play_file), title="Test Play", dry_run=True
+        )
 
         # Verify no database changes
         assert Play.objects.count() == initial_count
 
-    def test_command_with_title(self):
+    def test_command_with_title(self, tmp_path):
         """Test command with --title option."""
-        content = """ACT 1
-=====
-
-Scene 1
-=======
-
-SPEAKER
-Text.
-"""
-        play_file = create_temp_play_file(content)
+        play_file = tmp_path / "play.txt"
+        play_file.write_text(ONE_SPEECH_PLAY, encoding="utf-8")
 
         call_command("import_play", str(play_file), title="Custom Play Title")
 
@@ -1322,48 +1182,31 @@ Text.
         play = Play.objects.get(title="Custom Play Title")
         assert play is not None
 
-    def test_command_without_title(self):
+    def test_command_without_title(self, tmp_path):
         """Test command without --title option extracts title from filename."""
-        content = """ACT 1
-=====
+        # Create file with specific name
+        play_file = tmp_path / "test-play.txt"
+        play_file.write_text(ONE_SPEECH_PLAY, encoding="utf-8")
 
-Scene 1
-=======
+        call_command("import_play", str(play_file), title="Test Play")
 
-SPEAKER
-Text.
-"""
-        # Create file with specific name
-        fd, path = tempfile.mkstemp(suffix="test-play.txt", text=True)
-        with open(fd, "w", encoding="utf-8") as f:
-            f.write(content)
-        play_file = Path(path)
-
-        try:
-            call_command("import_play", str(play_file), title="Test Play")
-
-            # Verify title was extracted from filename
-            # Filename like "tmpXXXXXXtest-play.txt" -> "Test Play"
-            play = Play.objects.first()
-            assert play is not None
-            # Title extraction logic: stem.replace("-", " ").replace("_", " ").title()
-            # So "test-play" becomes "Test Play"
-        finally:
-            play_file.unlink(missing_ok=True)
+        # Verify title was extracted from filename
+        # Filename like "tmpXXXXXXtest-play.txt" -> "Test Play"
+        play = Play.objects.first()
+        assert play is not None
+        # Title extraction logic: stem.replace("-", " ").replace("_", " ").title()
+        # So "test-play" becomes "Test Play"
 
     def test_command_error_handling_missing_file(self):
         """Test command raises CommandError for missing file."""
         with pytest.raises(CommandError, match="File not found"):
             call_command("import_play", "/nonexistent/file.txt", title="Test Play")
 
-    def test_command_saves_to_database(self):
+    def test_command_saves_to_database(self, simple_play_file):
         """Test command saves to database when no --output-fixture or --dry-run."""
-        content = create_simple_play()
-        play_file = create_temp_play_file(content)
-
         initial_count = Play.objects.count()
 
-        call_command("import_play", str(play_file), title="Database Test Play")
+        call_command("import_play", str(simple_play_file), title="Database Test Play")
 
         # Verify play was saved
         assert Play.objects.count() == initial_count + 1
@@ -1393,6 +1236,74 @@ class TestSpeechIndex:
         # Should return all speeches (or empty queryset if none exist)
         assert hasattr(qs, "count")
 
+    def test_index_queryset_prepares_without_extra_queries(
+        self, django_assert_num_queries
+    ):
+        """Test preparing speeches from index_queryset needs only one query."""
+        play = Play.objects.create(title="Test Play")
+        act = Act.objects.create(play=play, name="Act 1", order=1)
+        scene = Scene.objects.create(act=act, name="Scene 1", order=1)
+        speaker = Speaker.objects.create(name="TEST SPEAKER")
+        for order in range(1, 4):
+            Speech.objects.create(
+                speaker=speaker, scene=scene, text=f"Speech {order}", order=order
+            )
+
+        index = SpeechIndex()
+        with django_assert_num_queries(1):
+            prepared = [
+                index.full_prepare(speech)
+                for speech in index.index_queryset().filter(scene=scene)
+            ]
+        assert [data["play_title"] for data in prepared] == ["Test Play"] * 3
+        assert [data["speaker_name"] for data in prepared] == ["TEST SPEAKER"] * 3
+
+    def test_prepare_values_matches_full_prepare(self):
+        """Test prepare_values() builds the same data as full_prepare()."""
+        play = Play.objects.create(title="Test Play")
+        act = Act.objects.create(play=play, name="Act 1", order=1)
+        scene = Scene.objects.create(act=act, name="Scene 1", order=1)
+        speaker = Speaker.objects.create(name="TEST SPEAKER")
+        speech = Speech.objects.create(
+            speaker=speaker,
+            scene=scene,
+            text="To be or not to be, that is the question.",
+            order=1,
+            is_soliloquy=True,
+        )
+
+        index = SpeechIndex()
+        row = Speech.objects.values(*index.VALUES_COLUMNS).get(pk=speech.pk)
+        assert index.prepare_values(row) == index.full_prepare(speech)
+
+        # And for every speech in the plays loaded by the migrations.
+        rows = {
+            row["id"]: row
+            for row in index.index_queryset().values(*index.VALUES_COLUMNS)
+        }
+        for speech in index.index_queryset():
+            assert index.prepare_values(rows[speech.pk]) == index.full_prepare(speech)
+
+    def test_prepare_values_rejects_null_values(self):
+        """Test prepare_values() raises for a null non-null field, like prepare()."""
+        play = Play.objects.create(title="Test Play")
+        act = Act.objects.create(play=play, name="Act 1", order=1)
+        scene = Scene.objects.create(act=act, name="Scene 1", order=1)
+        speaker = Speaker.objects.create(name="TEST SPEAKER")
+        speech = Speech.objects.create(
+            speaker=speaker, scene=scene, text="Speech", order=1
+        )
+
+        index = SpeechIndex()
+        row = Speech.objects.values(*index.VALUES_COLUMNS).get(pk=speech.pk)
+        row["scene__name"] = None
+        speech.scene.name = None
+        with pytest.raises(SearchFieldError):
+            index.full_prepare(speech)
+        with pytest.raises(SearchFieldError, match="scene__name"):
+            index.prepare_values(row)
+
+    @pytest.mark.opensearch
     def test_indexing_speech(self):
         """Test that a speech can be indexed."""
         # Create test data
@@ -1419,6 +1330,7 @@ class TestSpeechIndex:
         assert results.count() > 0
         assert speech in [r.object for r in results]
 
+    @pytest.mark.opensearch
     def test_searching_speech_text(self):
         """Test searching for words/phrases in speech text."""
         # Create test data
@@ -1456,6 +1368,7 @@ class TestSpeechIndex:
         assert results.count() == 1
         assert speech2 in [r.object for r in results]
 
+    @pytest.mark.opensearch
     def test_searching_by_speaker_name(self):
         """Test searching speeches by speaker name."""
         # Create test data
@@ -1493,6 +1406,7 @@ class TestSpeechIndex:
         # Verify we found at least our speech (may have fixture data too)
         assert len(all_results) >= 1
 
+    @pytest.mark.opensearch
     def test_facets_speaker(self):
         """Test speaker facet returns correct values."""
         # Create test data
@@ -1536,6 +1450,7 @@ class TestSpeechIndex:
         assert "SPEAKER ONE" in speaker_names
         assert "SPEAKER TWO" in speaker_names
 
+    @pytest.mark.opensearch
     def test_facets_act_scene_play(self):
         """Test act, scene, and play facets return correct values."""
         # Create test data
@@ -1595,6 +1510,7 @@ class TestSpeechIndex:
         assert "Play One" in play_titles
         assert "Play Two" in play_titles
 
+    @pytest.mark.opensearch
     def test_filtering_by_facets(self):
         """Test filtering speeches by facets."""
         # Create test data
@@ -1635,6 +1551,7 @@ class TestSpeechIndex:
         # Verify we found at least our speech (may have fixture data too)
         assert len(all_results) >= 1
 
+    @pytest.mark.opensearch
     def test_reindex_play(self):
         """Test reindex_play() method reindexes speeches for a play."""
         # Create test data
@@ -1672,6 +1589,7 @@ class TestSpeechIndex:
         assert results.count() == 1
         assert speech1 in [r.object for r in results]
 
+    @pytest.mark.opensearch
     def test_edge_case_empty_speech(self):
         """Test indexing speech with empty text."""
         play = Play.objects.create(title="Test Play")
@@ -1716,6 +1634,57 @@ class TestSpeakerIndex:
         # Should return all speakers (or empty queryset if none exist)
         assert hasattr(qs, "count")
 
+    def test_index_queryset_prepares_facets_without_extra_queries(
+        self, django_assert_num_queries
+    ):
+        """Test preparing speakers from index_queryset needs only two queries."""
+        play1 = Play.objects.create(title="Test Play One")
+        play2 = Play.objects.create(title="Test Play Two")
+        speakers = [
+            Speaker.objects.create(name="TEST SPEAKER ONE"),
+            Speaker.objects.create(name="TEST SPEAKER TWO"),
+        ]
+        for play in (play1, play2):
+            act = Act.objects.create(play=play, name="Act 1", order=1)
+            scene = Scene.objects.create(act=act, name="Scene 1", order=1)
+            for order, speaker in enumerate(speakers * 2, start=1):
+                Speech.objects.create(
+                    speaker=speaker, scene=scene, text="Speech", order=order
+                )
+
+        index = SpeakerIndex()
+        with django_assert_num_queries(2):
+            prepared = [
+                index.full_prepare(speaker)
+                for speaker in index.index_queryset().filter(
+                    pk__in=[speaker.pk for speaker in speakers]
+                )
+            ]
+        for data in prepared:
+            assert data["play"] == ["Test Play One", "Test Play Two"]
+            assert data["act"] == ["Act 1"]
+            assert data["scene"] == ["Scene 1"]
+
+    def test_cached_facets_match_speeches(self, django_assert_num_queries):
+        """Test prepare() reads facets from cached_facets() without querying."""
+        play = Play.objects.create(title="Test Play Cached")
+        act = Act.objects.create(play=play, name="Act 1", order=1)
+        scene = Scene.objects.create(act=act, name="Scene 1", order=1)
+        speaker = Speaker.objects.create(name="TEST SPEAKER CACHED")
+        silent = Speaker.objects.create(name="TEST SPEAKER SILENT")
+        Speech.objects.create(speaker=speaker, scene=scene, text="Speech", order=1)
+
+        index = SpeakerIndex()
+        expected = index.full_prepare(speaker)
+        with index.cached_facets(), django_assert_num_queries(0):
+            cached = index.full_prepare(speaker)
+            empty = index.full_prepare(silent)
+        assert index.facet_cache is None
+        for field in ("act", "scene", "play"):
+            assert cached[field] == expected[field]
+            assert empty[field] == []
+
+    @pytest.mark.opensearch
     def test_indexing_speaker(self):
         """Test that a speaker can be indexed."""
         speaker = Speaker.objects.create(name="TEST SPEAKER INDEX")
@@ -1732,6 +1701,7 @@ class TestSpeakerIndex:
         assert results.count() == 1
         assert speaker in [r.object for r in results]
 
+    @pytest.mark.opensearch
     def test_searching_speaker_names(self):
         """Test searching for speaker names."""
         speaker1 = Speaker.objects.create(name="TEST SPEAKER ONE")
@@ -1755,6 +1725,7 @@ class TestSpeakerIndex:
         assert results.count() == 1
         assert speaker2 in [r.object for r in results]
 
+    @pytest.mark.opensearch
     def test_multivalue_facets_all_appearances(self):
         """Test MultiValueField facets include all appearances across plays."""
         # Create test data with speaker appearing in multiple plays
@@ -1810,6 +1781,7 @@ class TestSpeakerIndex:
         scene_names = [f[0] for f in scene_facets]
         assert "Scene 1" in scene_names
 
+    @pytest.mark.opensearch
     def test_facets_update_on_reindex(self):
         """Test facets update correctly when speaker appears in new play."""
         # Create initial data
@@ -1864,6 +1836,7 @@ class TestSpeakerIndex:
         assert "Play One" in play_titles
         assert "Play Two" in play_titles
 
+    @pytest.mark.opensearch
     def test_reindex_play(self):
         """Test reindex_play() method reindexes speakers for a play."""
         # Create test data
@@ -1903,6 +1876,7 @@ class TestSpeakerIndex:
         assert results.count() >= 1
         assert speaker1 in [r.object for r in results]
 
+    @pytest.mark.opensearch
     def test_edge_case_speaker_no_speeches(self):
         """Test indexing speaker with no speeches."""
         speaker = Speaker.objects.create(name="SILENT SPEAKER")
@@ -1931,6 +1905,397 @@ class TestSpeakerIndex:
 
 
 @pytest.mark.django_db
+class TestBulkReindex:
+    """Test bulk_reindex() against a fake OpenSearch client."""
+
+    def test_reindex_play_inside_atomic(self, fake_backend):
+        """Test reindexing speeches that aren't committed yet sends them all."""
+        # As in a view under ATOMIC_REQUESTS, on top of the test's own
+        # transaction: any query from another thread's connection can't see
+        # these rows, and finds the tables locked.
+        with transaction.atomic():
+            play = Play.objects.create(title="Test Play Atomic")
+            act = Act.objects.create(play=play, name="Act 1", order=1)
+            scene = Scene.objects.create(act=act, name="Scene 1", order=1)
+            speaker = Speaker.objects.create(name="TEST SPEAKER ATOMIC")
+            speeches = [
+                Speech.objects.create(
+                    speaker=speaker, scene=scene, text=f"Speech {order}", order=order
+                )
+                for order in range(1, 6)
+            ]
+            fake_backend.batch_size = 2
+
+            SpeechIndex().reindex_play(play, backend=fake_backend)
+
+        assert sorted(metadata["_id"] for _, metadata, _ in fake_backend.conn.sent) == (
+            sorted(f"core.speech.{speech.pk}" for speech in speeches)
+        )
+        assert {op_type for op_type, _, _ in fake_backend.conn.sent} == {"update"}
+        fake_backend.conn.indices.refresh.assert_called_once_with(
+            index=fake_backend.index_name
+        )
+
+    def test_rounds_after_an_empty_round_are_sent(self, fake_backend):
+        """Test a round with no changed documents doesn't end the stream."""
+        play, ids = self.create_speeches(6)
+        fake_backend.batch_size = 1
+        with (
+            mock.patch("demo.core.search_indexes.REINDEX_THREAD_COUNT", 2),
+            mock.patch(
+                "demo.core.search_indexes.changed_documents",
+                side_effect=lambda backend, documents: [  # noqa: ARG005
+                    document for document in documents if document["_id"] in ids[4:]
+                ],
+            ),
+        ):
+            bulk_reindex(
+                SpeechIndex(),
+                Speech.objects.filter(scene__act__play=play).order_by("order"),
+                backend=fake_backend,
+                skip_unchanged=True,
+            )
+
+        sent = [metadata["_id"] for _, metadata, _ in fake_backend.conn.sent]
+        assert sorted(sent) == sorted(ids[4:])
+
+    def test_unchanged_speakers_are_skipped(self, fake_backend):
+        """Test only speakers whose indexed documents differ are sent."""
+        play = Play.objects.create(title="Test Play Unchanged")
+        act = Act.objects.create(play=play, name="Act 1", order=1)
+        scene = Scene.objects.create(act=act, name="Scene 1", order=1)
+        unchanged, changed, new = speakers = [
+            Speaker.objects.create(name=f"TEST SPEAKER {name}")
+            for name in ("UNCHANGED", "CHANGED", "NEW")
+        ]
+        for order, speaker in enumerate(speakers, start=1):
+            Speech.objects.create(
+                speaker=speaker, scene=scene, text="Speech", order=order
+            )
+        index = SpeakerIndex()
+        serializer = fake_backend.conn.transport.serializer
+        # What the index holds, as it would come back from OpenSearch
+        stored = {
+            document["_id"]: json.loads(serializer.dumps(document))
+            for document in fake_backend._prepare_documents_for_bulk(
+                index, [unchanged, changed]
+            )
+        }
+        stored[f"core.speaker.{changed.pk}"]["play"] = ["Some Other Play"]
+        fake_backend.conn.mget.side_effect = lambda index, body: {  # noqa: ARG005
+            "docs": [
+                {"_id": _id, "found": True, "_source": stored[_id]}
+                if _id in stored
+                else {"_id": _id, "found": False}
+                for _id in body["ids"]
+            ]
+        }
+
+        index.reindex_play(play, backend=fake_backend)
+
+        fake_backend.conn.mget.assert_called_once()
+        assert sorted(metadata["_id"] for _, metadata, _ in fake_backend.conn.sent) == [
+            f"core.speaker.{changed.pk}",
+            f"core.speaker.{new.pk}",
+        ]
+        assert {op_type for op_type, _, _ in fake_backend.conn.sent} == {"index"}
+
+    def test_unchanged_speakers_sent_when_mget_fails(self, fake_backend, caplog):
+        """Test every speaker is sent if the indexed ones can't be fetched."""
+        play = Play.objects.create(title="Test Play Mget")
+        act = Act.objects.create(play=play, name="Act 1", order=1)
+        scene = Scene.objects.create(act=act, name="Scene 1", order=1)
+        speakers = [
+            Speaker.objects.create(name=f"TEST SPEAKER MGET {order}")
+            for order in range(1, 4)
+        ]
+        for order, speaker in enumerate(speakers, start=1):
+            Speech.objects.create(
+                speaker=speaker, scene=scene, text="Speech", order=order
+            )
+        fake_backend.conn.mget.side_effect = TransportError(500, "error")
+
+        SpeakerIndex().reindex_play(play, backend=fake_backend)
+
+        assert sorted(metadata["_id"] for _, metadata, _ in fake_backend.conn.sent) == (
+            sorted(f"core.speaker.{speaker.pk}" for speaker in speakers)
+        )
+        assert "Could not fetch the indexed documents" in caplog.text
+
+    def test_as_upsert(self):
+        """Test as_upsert() turns an index action into a detect_noop upsert."""
+        document = {
+            "_index": "django_haystack_opensearch_demo",
+            "_id": "core.speech.1",
+            "id": "core.speech.1",
+            "text": "To be or not to be",
+        }
+        assert as_upsert(document) == {
+            "_op_type": "update",
+            "_index": "django_haystack_opensearch_demo",
+            "_id": "core.speech.1",
+            "doc": {"id": "core.speech.1", "text": "To be or not to be"},
+            "doc_as_upsert": True,
+            "detect_noop": True,
+        }
+
+    def test_silently_fail_logs_errors(self, fake_backend, caplog):
+        """Test a silently failing backend logs bulk errors instead of raising."""
+        fake_backend.conn.request_errors = [TransportError(500, "error")]
+        fake_backend.silently_fail = True
+        SpeechIndex().reindex_play(Play.objects.first(), backend=fake_backend)
+        assert "Failed to bulk index documents to OpenSearch" in caplog.text
+
+        fake_backend.conn.request_errors = [TransportError(500, "error")]
+        fake_backend.silently_fail = False
+        with pytest.raises(BulkIndexError):
+            SpeechIndex().reindex_play(Play.objects.first(), backend=fake_backend)
+
+    def create_speeches(self, count: int) -> tuple[Play, list[str]]:
+        """Create a play with ``count`` speeches, and return it and their ids."""
+        play = Play.objects.create(title="Test Play Retries")
+        act = Act.objects.create(play=play, name="Act 1", order=1)
+        scene = Scene.objects.create(act=act, name="Scene 1", order=1)
+        speaker = Speaker.objects.create(name="TEST SPEAKER RETRIES")
+        speeches = [
+            Speech.objects.create(
+                speaker=speaker, scene=scene, text=f"Speech {order}", order=order
+            )
+            for order in range(1, count + 1)
+        ]
+        return play, [f"core.speech.{speech.pk}" for speech in speeches]
+
+    def test_only_reindex_all_uses_prepare_values(self, fake_backend):
+        """Test reindex_play() prepares speeches with full_prepare()."""
+        play, ids = self.create_speeches(2)
+        with (
+            mock.patch.object(SpeechIndex, "prepare_values") as prepare_values,
+            mock.patch.object(
+                SpeechIndex,
+                "full_prepare",
+                autospec=True,
+                side_effect=SpeechIndex.full_prepare,
+            ) as full_prepare,
+        ):
+            SpeechIndex().reindex_play(play, backend=fake_backend)
+
+        prepare_values.assert_not_called()
+        assert full_prepare.call_count == len(ids)
+        assert sorted(metadata["_id"] for _, metadata, _ in fake_backend.conn.sent) == (
+            sorted(ids)
+        )
+
+    def test_retries_only_rate_limited_documents(self, fake_backend):
+        """Test only the documents rejected with a 429 are sent again."""
+        play, ids = self.create_speeches(3)
+        fake_backend.conn.statuses = {ids[1]: [429, 429]}
+        with (
+            mock.patch("demo.core.search_indexes.time.sleep") as sleep,
+            mock.patch("demo.core.search_indexes.random.random", return_value=0),
+        ):
+            SpeechIndex().reindex_play(play, backend=fake_backend)
+
+        sent = [metadata["_id"] for _, metadata, _ in fake_backend.conn.sent]
+        assert sorted(sent[:3]) == sorted(ids)
+        assert sent[3:] == [ids[1], ids[1]]
+        assert sleep.call_args_list == [mock.call(0.5), mock.call(1.0)]
+
+    def test_retries_rate_limited_requests(self, fake_backend):
+        """Test a whole request rejected with a 429 is sent again."""
+        play, ids = self.create_speeches(2)
+        fake_backend.conn.request_errors = [TransportError(429, "rate limited")]
+        with mock.patch("demo.core.search_indexes.time.sleep") as sleep:
+            SpeechIndex().reindex_play(play, backend=fake_backend)
+
+        sent = [metadata["_id"] for _, metadata, _ in fake_backend.conn.sent]
+        assert sorted(sent) == sorted(ids)
+        assert sleep.call_count == 1
+
+    def test_backoff_schedule(self, fake_backend):
+        """Test the backoff doubles up to its cap, then gives up."""
+        play, ids = self.create_speeches(1)
+        fake_backend.conn.statuses = {ids[0]: [429] * (REINDEX_MAX_RETRIES + 1)}
+        with (
+            mock.patch("demo.core.search_indexes.REINDEX_MAX_BACKOFF", 2),
+            mock.patch("demo.core.search_indexes.time.sleep") as sleep,
+            mock.patch("demo.core.search_indexes.random.random", return_value=0.25),
+            pytest.raises(BulkIndexError, match="still rate limited"),
+        ):
+            SpeechIndex().reindex_play(play, backend=fake_backend)
+
+        assert [args[0] for args, _ in sleep.call_args_list] == [
+            0.75,
+            1.25,
+            2.25,
+            2.25,
+            2.25,
+        ]
+        assert len(fake_backend.conn.sent) == REINDEX_MAX_RETRIES + 1
+
+    def test_other_errors_are_not_retried(self, fake_backend):
+        """Test documents rejected for anything but rate limiting raise at once."""
+        play, ids = self.create_speeches(2)
+        fake_backend.conn.statuses = {ids[0]: [400]}
+        with (
+            mock.patch("demo.core.search_indexes.time.sleep") as sleep,
+            pytest.raises(BulkIndexError, match="1 document"),
+        ):
+            SpeechIndex().reindex_play(play, backend=fake_backend)
+
+        assert len(fake_backend.conn.sent) == 2
+        sleep.assert_not_called()
+
+
+@pytest.mark.django_db
+class TestBulkIndexingSettings:
+    """Test bulk_indexing_settings() and reindex_all() against a fake client."""
+
+    PREVIOUS: Final[dict[str, str]] = {
+        "refresh_interval": "5s",
+        "number_of_replicas": "1",
+    }
+
+    @pytest.fixture
+    def backend(self, fake_backend):
+        """The fake backend, with an index that has settings of its own."""
+        fake_backend.conn.indices.get_settings.return_value = {
+            "django_haystack_opensearch_demo_v1": {
+                "settings": {"index": {**self.PREVIOUS, "number_of_shards": "1"}}
+            }
+        }
+        return fake_backend
+
+    def test_settings_restored_when_body_raises(self, backend):
+        """Test the original settings come back if the body of the context raises."""
+        indices = backend.conn.indices
+        tuned = []
+
+        def reindex() -> None:
+            tuned.append(indices.put_settings.call_args)
+            msg = "reindexing failed"
+            raise RuntimeError(msg)
+
+        with pytest.raises(RuntimeError), bulk_indexing_settings(backend):
+            reindex()
+
+        assert tuned == [
+            mock.call(
+                index=backend.index_name,
+                body={"index": {"refresh_interval": "-1", "number_of_replicas": 0}},
+            )
+        ]
+        assert indices.put_settings.call_args == mock.call(
+            index=backend.index_name, body={"index": self.PREVIOUS}
+        )
+        indices.refresh.assert_called_once_with(index=backend.index_name)
+
+    def test_reindex_all_logs_failed_restore(self, backend, caplog):
+        """Test reindex_all() logs, rather than raises, a failure to restore."""
+        indices = backend.conn.indices
+        indices.put_settings.side_effect = [None, TransportError(500, "error")]
+        with mock.patch.object(SpeechIndex, "get_backend", return_value=backend):
+            reindex_all()
+
+        assert backend.conn.sent
+        assert "Could not restore the settings" in caplog.text
+        assert "Error tuning the search index for reindexing" in caplog.text
+        indices.refresh.assert_called_once_with(index=backend.index_name)
+
+    def test_reindex_all_logs_failed_settings(self, backend, caplog):
+        """Test reindex_all() still reindexes if the index can't be tuned."""
+        backend.conn.indices.get_settings.side_effect = TransportError(500, "error")
+        with (
+            mock.patch.object(SpeechIndex, "get_backend", return_value=backend),
+            mock.patch.object(
+                SpeechIndex,
+                "prepare_values",
+                autospec=True,
+                side_effect=SpeechIndex.prepare_values,
+            ) as prepare_values,
+        ):
+            reindex_all()
+
+        assert prepare_values.call_count == Speech.objects.count()
+        # Only the tuning is skipped: everything is still indexed, and refreshed
+        sent = {metadata["_id"] for _, metadata, _ in backend.conn.sent}
+        assert f"core.speech.{Speech.objects.first().pk}" in sent
+        assert f"core.speaker.{Speaker.objects.first().pk}" in sent
+        assert "Could not tune OpenSearch index" in caplog.text
+        backend.conn.indices.put_settings.assert_not_called()
+        backend.conn.indices.refresh.assert_called_once_with(index=backend.index_name)
+
+    def test_setup_errors_honour_silently_fail(self, backend, caplog):
+        """Test a failed setup is raised, unless the backend silently fails."""
+        backend.setup_complete = False
+        with (
+            mock.patch.object(
+                backend, "setup", side_effect=TransportError(500, "error")
+            ),
+            pytest.raises(TransportError),
+            bulk_indexing_settings(backend),
+        ):
+            pass
+
+        backend.silently_fail = True
+        with (
+            mock.patch.object(
+                backend, "setup", side_effect=TransportError(500, "error")
+            ),
+            bulk_indexing_settings(backend),
+        ):
+            pass
+        assert "Failed to add documents to OpenSearch" in caplog.text
+        backend.conn.indices.get_settings.assert_not_called()
+        backend.conn.indices.refresh.assert_not_called()
+
+
+@pytest.mark.django_db
+class TestAdminLabels:
+    """Test the admin loads the related objects our labels use."""
+
+    def test_labels_use_related_objects(self):
+        """Test __str__ gives the full label even when nothing is preloaded."""
+        play = Play.objects.create(title="Test Play")
+        act = Act.objects.create(play=play, name="Act 1", order=1)
+        scene = Scene.objects.create(act=act, name="Scene 1", order=1)
+        speaker = Speaker.objects.create(name="TEST SPEAKER")
+        speech = Speech.objects.create(
+            speaker=speaker, scene=scene, text="Speech", order=1
+        )
+        assert str(Act.objects.get(pk=act.pk)) == "Test Play - Act 1"
+        assert str(Scene.objects.get(pk=scene.pk)) == "Test Play - Act 1 - Scene 1"
+        assert str(Speech.objects.get(pk=speech.pk)) == (
+            "TEST SPEAKER in Test Play - Act 1 - Scene 1 (order 1)"
+        )
+
+    def test_filter_choices_load_labels_in_one_query(
+        self, rf, django_assert_num_queries
+    ):
+        """Test the scene filter labels every scene from a single query."""
+        request = rf.get("/admin/core/speech/")
+        field = Speech._meta.get_field("scene")
+        with django_assert_num_queries(1):
+            choices = LabelRelatedFieldListFilter(
+                field, request, {}, Speech, site._registry[Speech], "scene"
+            ).lookup_choices
+        assert len(choices) == Scene.objects.count() > 1
+
+    def test_foreign_key_choices_load_labels_in_one_query(
+        self, rf, django_assert_num_queries
+    ):
+        """Test the speech form labels every scene choice from a single query."""
+        request = rf.get("/admin/core/speech/add/")
+        formfield = site._registry[Speech].formfield_for_foreignkey(
+            Speech._meta.get_field("scene"), request
+        )
+        # list() counts the choices first, for its length hint.
+        with django_assert_num_queries(2):
+            choices = list(formfield.choices)
+        assert len(choices) == Scene.objects.count() + 1
+
+
+@pytest.mark.django_db
+@pytest.mark.opensearch
 class TestReindexAll:
     """Test the reindex_all() function."""
 
@@ -2077,6 +2442,7 @@ class TestReindexAll:
 
 
 @pytest.mark.django_db
+@pytest.mark.opensearch
 class TestBackendRemoveOperations:
     """Test the remove() method of the OpenSearch backend."""
 
@@ -2162,6 +2528,7 @@ class TestBackendRemoveOperations:
 
 
 @pytest.mark.django_db
+@pytest.mark.opensearch
 class TestBackendClearOperations:
     """Test the clear() method of the OpenSearch backend."""
 
@@ -2242,6 +2609,7 @@ class TestBackendClearOperations:
 
 
 @pytest.mark.django_db
+@pytest.mark.opensearch
 class TestMoreLikeThis:
     """Test the more_like_this() method of the OpenSearch backend."""
 
@@ -2328,6 +2696,7 @@ class TestMoreLikeThis:
 
 
 @pytest.mark.django_db
+@pytest.mark.opensearch
 class TestSearchSorting:
     """
     Test sorting functionality in search.
@@ -2407,6 +2776,7 @@ class TestSearchSorting:
 
 
 @pytest.mark.django_db
+@pytest.mark.opensearch
 class TestSearchHighlighting:
     """Test highlighting functionality in search."""
 
@@ -2444,6 +2814,7 @@ class TestSearchHighlighting:
 
 
 @pytest.mark.django_db
+@pytest.mark.opensearch
 class TestPagination:
     """Test pagination functionality in search."""
 
@@ -2491,6 +2862,7 @@ class TestPagination:
 
 
 @pytest.mark.django_db
+@pytest.mark.opensearch
 class TestQueryFilters:
     """Test query filter types (contains, startswith, etc.)."""
 
@@ -2560,6 +2932,7 @@ class TestQueryFilters:
 
 
 @pytest.mark.django_db
+@pytest.mark.opensearch
 class TestSpecialQueryCases:
     """Test special query cases like empty queries, match all, etc."""
 
@@ -2594,6 +2967,7 @@ class TestSpecialQueryCases:
 
 
 @pytest.mark.django_db
+@pytest.mark.opensearch
 class TestFieldTypeMappings:
     """Test different field type mappings."""
 
@@ -2674,6 +3048,7 @@ class TestFieldTypeMappings:
 
 
 @pytest.mark.django_db
+@pytest.mark.opensearch
 class TestDataConversion:
     """Test _from_python, _to_python, and _iso_datetime methods."""
 
@@ -2716,6 +3091,7 @@ class TestDataConversion:
 
 
 @pytest.mark.django_db
+@pytest.mark.opensearch
 class TestSchemaBuilding:
     """Test build_schema method."""
 
@@ -2741,6 +3117,7 @@ class TestSchemaBuilding:
 
 
 @pytest.mark.django_db
+@pytest.mark.opensearch
 class TestIndexSetup:
     """Test setup() method."""
 
@@ -2769,6 +3146,7 @@ class TestIndexSetup:
 
 
 @pytest.mark.django_db
+@pytest.mark.opensearch
 class TestCommitParameter:
     """Test commit=True vs commit=False behavior."""
 
@@ -2802,6 +3180,7 @@ class TestCommitParameter:
 
 
 @pytest.mark.django_db
+@pytest.mark.opensearch
 class TestResultProcessing:
     """Test result processing including field conversion."""
 
@@ -2839,6 +3218,7 @@ class TestResultProcessing:
 
 
 @pytest.mark.django_db
+@pytest.mark.opensearch
 class TestIntegrationScenarios:
     """Test complex, real-world scenarios."""
 
@@ -2925,6 +3305,7 @@ class TestIntegrationScenarios:
 
 
 @pytest.mark.django_db
+@pytest.mark.opensearch
 class TestPlayIndex:
     """Test the PlayIndex search index."""
 
@@ -2964,6 +3345,7 @@ class TestPlayIndex:
 
 
 @pytest.mark.django_db
+@pytest.mark.opensearch
 class TestSpellingSuggestions:
     """Test spelling suggestions functionality."""
 
@@ -3002,6 +3384,7 @@ class TestSpellingSuggestions:
 
 
 @pytest.mark.django_db
+@pytest.mark.opensearch
 class TestDateFacets:
     """Test date facets functionality."""
 
@@ -3039,6 +3422,7 @@ class TestDateFacets:
 
 
 @pytest.mark.django_db
+@pytest.mark.opensearch
 class TestQueryFacets:
     """Test query facets functionality."""
 
@@ -3087,6 +3471,7 @@ class TestQueryFacets:
 
 
 @pytest.mark.django_db
+@pytest.mark.opensearch
 class TestNarrowQueries:
     """Test narrow queries functionality."""
 
@@ -3157,6 +3542,7 @@ class TestNarrowQueries:
 
 
 @pytest.mark.django_db
+@pytest.mark.opensearch
 class TestFieldSelection:
     """Test stored_fields parameter functionality."""
 
@@ -3196,6 +3582,7 @@ class TestFieldSelection:
 
 
 @pytest.mark.django_db
+@pytest.mark.opensearch
 class TestFacetAdvancedFeatures:
     """Test advanced facet features."""
 
@@ -3234,6 +3621,7 @@ class TestFacetAdvancedFeatures:
 
 
 @pytest.mark.django_db
+@pytest.mark.opensearch
 class TestQueryBuildingDetails:
     """Test query building details."""
 
@@ -3267,6 +3655,7 @@ class TestQueryBuildingDetails:
 
 
 @pytest.mark.django_db
+@pytest.mark.opensearch
 class TestModelFiltering:
     """Test model filtering functionality."""
 
@@ -3331,6 +3720,7 @@ class TestModelFiltering:
 
 
 @pytest.mark.django_db
+@pytest.mark.opensearch
 class TestErrorHandling:
     """Test error handling functionality."""
 
@@ -399,6 +399,17 @@ HAYSTACK_CONNECTIONS: dict[str, Any] = {
         "URL": "http://host.docker.internal:9200/",
         "INDEX_NAME": "django_haystack_opensearch_demo",
         "INCLUDE_SPELLING": True,
+        # Bulk reindexing can take a while on a busy cluster.
+        "TIMEOUT": 60,
+        "KWARGS": {
+            # Keep enough connections in the pool for all the threads
+            # demo.core.search_indexes.bulk_reindex() sends bulk requests from,
+            # so that they reuse their connections instead of opening new ones.
+            "pool_maxsize": 16,
+            "retry_on_timeout": True,
+            # Gzip request bodies; bulk requests full of speech text shrink a lot.
+            "http_compress": True,
+        },
     },
 }
 